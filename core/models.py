@@ -4,11 +4,113 @@ TreasureGoblin Core Models
 Main data model and database logic for the TreasureGoblin application.
 """
 
+import bisect
+from contextlib import closing, contextmanager
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import chain
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 
 
+# Statement text for the frequently run queries is kept constant so sqlite3's statement cache can reuse the
+# compiled plans
+INSERT_TRANSACTION_SQL = '''
+    INSERT INTO transactions (type, amount, date, category_id, tag)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+# Rows per multi-row INSERT, kept under SQLite's historical limit of 999 bound parameters per statement
+INSERT_BATCH_SIZE = min(100, 999 // 5)
+
+INSERT_TRANSACTIONS_BATCH_SQL = (
+    "INSERT INTO transactions (type, amount, date, category_id, tag) VALUES "
+    + ", ".join(["(?, ?, ?, ?, ?)"] * INSERT_BATCH_SIZE)
+)
+
+# Total balance, one month's income and expenses and the previous month's net, summed from the per-month
+# totals so the cost depends on the number of months and categories rather than transactions
+DASHBOARD_SUMMARY_SQL = '''
+    SELECT
+        SUM(CASE WHEN type = 'income' THEN total ELSE -total END) as total_balance,
+        SUM(CASE WHEN type = 'income' AND month = :current_month THEN total ELSE 0 END) as current_income,
+        SUM(CASE WHEN type = 'expense' AND month = :current_month THEN total ELSE 0 END) as current_expenses,
+        SUM(CASE WHEN month = :previous_month
+            THEN CASE WHEN type = 'income' THEN total ELSE -total END
+            ELSE 0 END) as previous_net
+    FROM transaction_monthly_totals
+'''
+
+# Recompute every per-month total from the transactions table
+REBUILD_MONTHLY_TOTALS_SQL = '''
+    DELETE FROM transaction_monthly_totals;
+    INSERT INTO transaction_monthly_totals (month, type, category_id, total, count)
+        SELECT substr(date, 1, 7), type, category_id, SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY substr(date, 1, 7), type, category_id;
+'''
+
+RECENT_TRANSACTIONS_SQL = '''
+    SELECT t.id, t.date, t.amount / 100.0 as amount, t.type, c.name as category, t.tag
+    FROM transactions t
+    JOIN categories c ON t.category_id = c.id
+    ORDER BY t.date DESC, t.id DESC
+    LIMIT ?
+'''
+
+def to_cents(amount):
+    """
+    Convert a dollar amount to the integer number of cents it is stored as.
+
+    Parameters:
+        amount (float, str or Decimal): Amount in dollars
+
+    Returns:
+        int: Amount in cents, rounded half up to the nearest cent
+    """
+    # Going through the decimal string avoids binary float error, e.g. 1.005 * 100 == 100.49999999999999
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def month_bounds(year, month):
+    """
+    Get the ISO date range covering a month, for use in sargable date predicates.
+
+    Parameters:
+        year (int): Year of the month
+        month (int): Month (1-12)
+
+    Returns:
+        tuple: (start, end) ISO date strings where start is the first day of the month and end is the first
+        day of the following month, so a month matches with `date >= start AND date < end`
+    """
+    if month == 12:
+        return f"{year}-12-01", f"{year + 1}-01-01"
+    return f"{year}-{month:02d}-01", f"{year}-{month + 1:02d}-01"
+
+
+def insert_transactions(cursor, rows):
+    """
+    Insert transaction rows using multi-row INSERT statements.
+
+    Full batches of INSERT_BATCH_SIZE rows go through one prepared multi-row statement, which cuts the number of
+    statement executions by that factor; the leftover rows use the single-row statement. The caller is
+    responsible for wrapping the call in a transaction.
+
+    Parameters:
+        cursor (sqlite3.Cursor): Cursor to insert with
+        rows (list): (type, amount_cents, iso_date, category_id, tag) tuples
+    """
+    full_batches = len(rows) - len(rows) % INSERT_BATCH_SIZE
+    cursor.executemany(INSERT_TRANSACTIONS_BATCH_SQL, (
+        tuple(chain.from_iterable(rows[start:start + INSERT_BATCH_SIZE]))
+        for start in range(0, full_batches, INSERT_BATCH_SIZE)
+    ))
+    cursor.executemany(INSERT_TRANSACTION_SQL, rows[full_batches:])
+
+
 class TreasureGoblin:
     """
     TreasureGoblin is your personal finance companion, helping you track spending and build wealth through smarter money
@@ -16,6 +118,24 @@ class TreasureGoblin:
     from now!
     """
 
+    # Database files that have already been switched to WAL journaling (and to PAGE_SIZE pages)
+    _wal_databases = set()
+
+    # Page size, in bytes, database files are created with or rebuilt to
+    PAGE_SIZE = 8192
+
+    # Bytes of the database file read through a memory map instead of read() calls
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    # Current database schema version, recorded in PRAGMA user_version
+    SCHEMA_VERSION = 3
+
+    # Most read-only connections kept open for reuse by read_connection()
+    READER_POOL_SIZE = 4
+
+    # Number of newest transactions listed on the dashboard
+    RECENT_TRANSACTION_COUNT = 5
+
     def __init__(self, db_path=None):
         """
         Initialize the SQLite database for TreasureGoblin with necessary tables.
@@ -31,6 +151,10 @@ class TreasureGoblin:
             db_path = user_data_dir / "treasuregoblin.db"
 
         self.db_path = db_path
+        # Each thread keeps one long-lived connection (sqlite3 connections can't be shared across threads)
+        self._local = threading.local()
+        # Idle read-only connections, handed out one at a time by read_connection()
+        self._readers = queue.Queue(maxsize=self.READER_POOL_SIZE)
         self.app_dir = Path.home() / ".treasuregoblin"
         self.media_dir = self.app_dir / "media"
         # Create application directories if they don't exist
@@ -39,84 +163,329 @@ class TreasureGoblin:
         # Initialize database
         self.setup_database()
 
-        # Initialize Google Drive sync (lazy import to avoid circular dependency)
-        from services.google_drive import GoogleDriveSync
-        self.drive_sync = GoogleDriveSync(self)
+        # Google Drive sync is created on first use, see the drive_sync property
+        self._drive_sync = None
+
+    @property
+    def drive_sync(self):
+        """The GoogleDriveSync instance, imported and created on first access so startup doesn't load it."""
+        if self._drive_sync is None:
+            # Imported here to avoid a circular dependency
+            from services.google_drive import GoogleDriveSync
+            self._drive_sync = GoogleDriveSync(self)
+        return self._drive_sync
 
     def setup_database(self):
         """Create the database and tables if they don't exist."""
         conn = self.get_db_connection()
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
 
-        # Create categories table
-        cursor.execute('''
+        # Schema version of the existing file (0 for new databases and ones created before versioning)
+        schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        category_columns = [column[1] for column in conn.execute("PRAGMA table_info(categories)")]
+
+        # All schema, migration and seed work is sent to SQLite as one script and runs as a single transaction
+        script = ["BEGIN IMMEDIATE;"]
+
+        # Create categories table. The id is the rowid, so joins from transactions are direct b-tree
+        # lookups, and the UNIQUE(name, type) index already covers name -> id resolution. WITHOUT ROWID
+        # would push every join through a secondary index instead.
+        script.append('''
             CREATE TABLE IF NOT EXISTS categories (
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL,
                 type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
                 is_system BOOLEAN DEFAULT FALSE,
                 UNIQUE(name, type)
-            )
+            );
         ''')
 
-        # Check if is_system column exists, if not, add it
-        cursor.execute("PRAGMA table_info(categories)")
-        columns = [column[1] for column in cursor.fetchall()]
+        if schema_version < 1:
+            # Check if is_system column exists, if not, add it
+            if category_columns and 'is_system' not in category_columns:
+                print("Adding is_system column to categories table...")
+                script.append('ALTER TABLE categories ADD COLUMN is_system BOOLEAN DEFAULT FALSE;')
 
-        if 'is_system' not in columns:
-            print("Adding is_system column to categories table...")
-            cursor.execute('ALTER TABLE categories ADD COLUMN is_system BOOLEAN DEFAULT FALSE')
+            # Update existing categories to have is_system = FALSE if it's currently NULL
+            script.append('UPDATE categories SET is_system = FALSE WHERE is_system IS NULL;')
 
         # Create transactions table
-        cursor.execute('''
+        script.append('''
             CREATE TABLE IF NOT EXISTS transactions (
-            id INTEGER PRIMARY KEY,
-            type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
-            amount DECIMAL(10, 2) NOT NULL,
-            date DATE NOT NULL,
-            category_id INTEGER NOT NULL,
-            tag TEXT,
-            FOREIGN KEY (category_id) REFERENCES categories(id)
-        )
+                id INTEGER PRIMARY KEY,
+                type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
+                amount INTEGER NOT NULL,
+                date DATE NOT NULL,
+                category_id INTEGER NOT NULL,
+                tag TEXT,
+                FOREIGN KEY (category_id) REFERENCES categories(id)
+            );
         ''')
 
-        # Insert system {NO_CATEGORY} categories first
-        cursor.execute('''
-            INSERT OR IGNORE INTO CATEGORIES (name, type, is_system)
-            VALUES ('{NO_CATEGORY}', 'income', TRUE)
+        if schema_version < 2:
+            # Amounts used to be stored as dollars; store them as integer cents so sums are exact
+            script.append('UPDATE transactions SET amount = CAST(ROUND(amount * 100) AS INTEGER);')
+
+        # Per-month totals (in cents) and transaction counts for each type and category, kept in step with the
+        # transactions table by the triggers below. Rows are removed when their count drops to zero, so the
+        # table only lists months that have transactions.
+        script.append('''
+            CREATE TABLE IF NOT EXISTS transaction_monthly_totals (
+                month TEXT NOT NULL,
+                type TEXT NOT NULL,
+                category_id INTEGER NOT NULL,
+                total INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (month, type, category_id)
+            ) WITHOUT ROWID;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tx_totals_insert AFTER INSERT ON transactions
+            BEGIN
+                INSERT INTO transaction_monthly_totals (month, type, category_id, total, count)
+                VALUES (substr(NEW.date, 1, 7), NEW.type, NEW.category_id, NEW.amount, 1)
+                ON CONFLICT (month, type, category_id)
+                DO UPDATE SET total = total + excluded.total, count = count + 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tx_totals_delete AFTER DELETE ON transactions
+            BEGIN
+                UPDATE transaction_monthly_totals SET total = total - OLD.amount, count = count - 1
+                WHERE month = substr(OLD.date, 1, 7) AND type = OLD.type AND category_id = OLD.category_id;
+                DELETE FROM transaction_monthly_totals
+                WHERE month = substr(OLD.date, 1, 7) AND type = OLD.type AND category_id = OLD.category_id
+                    AND count = 0;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tx_totals_update
+            AFTER UPDATE OF type, amount, date, category_id ON transactions
+            BEGIN
+                UPDATE transaction_monthly_totals SET total = total - OLD.amount, count = count - 1
+                WHERE month = substr(OLD.date, 1, 7) AND type = OLD.type AND category_id = OLD.category_id;
+                DELETE FROM transaction_monthly_totals
+                WHERE month = substr(OLD.date, 1, 7) AND type = OLD.type AND category_id = OLD.category_id
+                    AND count = 0;
+                INSERT INTO transaction_monthly_totals (month, type, category_id, total, count)
+                VALUES (substr(NEW.date, 1, 7), NEW.type, NEW.category_id, NEW.amount, 1)
+                ON CONFLICT (month, type, category_id)
+                DO UPDATE SET total = total + excluded.total, count = count + 1;
+            END;
         ''')
-        cursor.execute('''
-            INSERT OR IGNORE INTO CATEGORIES (name, type, is_system)
-            VALUES ('{NO_CATEGORY}', 'expense', TRUE)
+
+        if schema_version < 3:
+            # Fill the totals from the transactions already in the file
+            script.append(REBUILD_MONTHLY_TOTALS_SQL)
+
+        # Index dates so month/year filters and newest-first ordering use a range scan. The index carries
+        # every column the transaction lists read, so those queries never visit the table itself; it
+        # replaces the narrower (date, category_id) index rather than adding a second date index to maintain.
+        script.append('DROP INDEX IF EXISTS idx_tx_date_cat;')
+        script.append('CREATE INDEX IF NOT EXISTS idx_tx_date_desc_cover '
+                      'ON transactions(date DESC, type, amount, category_id, tag);')
+
+        # Index the foreign key so per-category updates and the child-row check on category delete don't scan
+        script.append('CREATE INDEX IF NOT EXISTS idx_tx_cat ON transactions(category_id);')
+
+        # System {NO_CATEGORY} categories first, then the default categories for each type
+        script.append('''
+            INSERT OR IGNORE INTO categories (name, type, is_system) VALUES
+                ('{NO_CATEGORY}', 'income', TRUE), ('{NO_CATEGORY}', 'expense', TRUE),
+                ('Paycheck', 'income', FALSE), ('Freelance', 'income', FALSE), ('Investment', 'income', FALSE),
+                ('Gift', 'income', FALSE), ('Other Income', 'income', FALSE),
+                ('Grocery', 'expense', FALSE), ('Housing', 'expense', FALSE), ('Transportation', 'expense', FALSE),
+                ('Utilities', 'expense', FALSE), ('Entertainment', 'expense', FALSE), ('Dining', 'expense', FALSE),
+                ('Healthcare', 'expense', FALSE), ('Education', 'expense', FALSE), ('Shopping', 'expense', FALSE),
+                ('Bills', 'expense', FALSE), ('Gas', 'expense', FALSE), ('Other Expense', 'expense', FALSE);
         ''')
 
-        # Insert default categories
-        default_income_categories = ['Paycheck', 'Freelance', 'Investment', 'Gift', 'Other Income']
-        default_expense_categories = ['Grocery', 'Housing', 'Transportation', 'Utilities', 'Entertainment', 'Dining',
-                                      'Healthcare',
-                                      'Education', 'Shopping', 'Bills', 'Gas', 'Other Expense']
+        if schema_version < self.SCHEMA_VERSION:
+            script.append(f"PRAGMA user_version = {self.SCHEMA_VERSION};")
+
+        script.append("COMMIT;")
+
+        try:
+            conn.executescript("\n".join(script))
+        except sqlite3.Error:
+            # executescript stops at the failing statement and leaves the transaction open
+            conn.rollback()
+            raise
+
+        self.invalidate_category_cache()
+
+    def invalidate_category_cache(self):
+        """
+        Reload the in-memory (name, type) -> id category map, the sorted per-type lists of selectable
+        category names and the {NO_CATEGORY} IDs.
 
-        # Insert income categories
-        for category in default_income_categories:
-            cursor.execute('INSERT OR IGNORE INTO categories (name, type, is_system) VALUES (?, ?, ?)',
-                           (category, 'income', False))
+        Must be called after categories are renamed or deleted outside of this class, or after the database
+        file is replaced, so stale names don't resolve to the wrong category.
+        """
+        conn = self.get_db_connection()
+        self._category_cache = {
+            (name, category_type): category_id
+            for name, category_type, category_id in conn.execute("SELECT name, type, id FROM categories")
+        }
+        self._categories_by_type = {'income': [], 'expense': []}
+        for name, category_type in conn.execute(
+                "SELECT name, type FROM categories WHERE is_system IS NULL OR is_system = FALSE ORDER BY name"):
+            self._categories_by_type.setdefault(category_type, []).append(name)
+        self._no_category_ids = dict(
+            conn.execute("SELECT type, id FROM categories WHERE name = '{NO_CATEGORY}'").fetchall()
+        )
 
-        # Insert expense categories
-        for category in default_expense_categories:
-            cursor.execute('INSERT OR IGNORE INTO categories (name, type, is_system) VALUES (?, ?, ?)',
-                           (category, 'expense', False))
+    def _cache_category(self, name, transaction_type, category_id):
+        """Record a committed category in the in-memory caches, keeping the name lists sorted."""
+        if (name, transaction_type) not in self._category_cache:
+            bisect.insort(self._categories_by_type.setdefault(transaction_type, []), name)
+        self._category_cache[(name, transaction_type)] = category_id
 
-        # Update existing categories to have is_system = FALSE if it's currently NULL
-        cursor.execute('UPDATE categories SET is_system = FALSE WHERE is_system IS NULL')
+    def rebuild_monthly_totals(self):
+        """
+        Recompute transaction_monthly_totals from the transactions table in one transaction.
 
-        # Commit changes and close connection
-        conn.commit()
-        conn.close()
+        The triggers keep the totals current on their own; this is for repairing a file whose totals were
+        changed or written without them.
+        """
+        conn = self.get_db_connection()
+        try:
+            conn.executescript(f"BEGIN IMMEDIATE; {REBUILD_MONTHLY_TOTALS_SQL} COMMIT;")
+        except sqlite3.Error:
+            # executescript stops at the failing statement and leaves the transaction open
+            conn.rollback()
+            raise
 
     def get_db_connection(self):
-        """Establish and return a database connection."""
-        return sqlite3.connect(self.db_path)
+        """
+        Return the database connection for the calling thread, opening it on first use.
+
+        The connection is kept open and reused so SQLite's page cache, statement cache and PRAGMA settings
+        survive between calls. Callers must not close it; use close_db_connection() instead.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        # A larger statement cache keeps every hot query prepared between calls
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
+        # Rows support both index and column-name access without building a dict per row
+        conn.row_factory = sqlite3.Row
+
+        # Journal mode and page size are persisted in the database file, so they only need to be set once per
+        # file (in-memory databases can't use WAL)
+        if str(self.db_path) != ':memory:' and str(self.db_path) not in TreasureGoblin._wal_databases:
+            if conn.execute("PRAGMA page_size").fetchone()[0] != self.PAGE_SIZE:
+                # A new file takes the page size when its first page is written. An existing one has to be
+                # rebuilt with VACUUM, which can't change the page size of a database in WAL mode.
+                conn.execute("PRAGMA journal_mode = DELETE")
+                conn.execute(f"PRAGMA page_size = {self.PAGE_SIZE}")
+                conn.execute("VACUUM")
+            conn.execute("PRAGMA journal_mode = WAL")
+            TreasureGoblin._wal_databases.add(str(self.db_path))
+
+        # The remaining settings only last for the lifetime of the connection
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def write_transaction(self):
+        """
+        Run the with block as a write transaction on this thread's connection.
+
+        The write lock is taken up front with BEGIN IMMEDIATE, so a competing writer makes the transaction wait
+        (up to busy_timeout) before any work is done, rather than failing with SQLITE_BUSY part way through.
+        Commits when the block exits normally and rolls back if it raises.
+
+        If the connection is already inside a transaction, the block joins it instead, and committing or rolling
+        back is left to whoever opened the outer transaction.
+        """
+        conn = self.get_db_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
+        except Exception:
+            # Categories cached by writes that joined this transaction were rolled back with it
+            self.invalidate_category_cache()
+            raise
+
+    def close_db_connection(self):
+        """Close the calling thread's database connection, if one is open, and the idle pooled readers."""
+        # Readers go first: the last connection to close checkpoints the write-ahead log into the database file
+        # and removes it, which a read-only connection can't do
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Borrow a read-only connection for the with block, from the pool or newly opened if none are idle.
+
+        Under WAL, readers never wait on the writer, so reads from any thread can run alongside writes. An in-memory
+        database only exists on its own connection, so it's read through this thread's connection instead.
+        """
+        if str(self.db_path) == ':memory:':
+            yield self.get_db_connection()
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self.open_read_only_connection()
+
+        try:
+            yield conn
+        finally:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def open_read_only_connection(self):
+        """
+        Open a separate read-only connection, for reading from another thread without touching the write lock.
+
+        The connection may be passed between threads but must only be used by one at a time. The caller owns it
+        and must close it.
+        """
+        conn = sqlite3.connect(
+            Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        return conn
+
+    def checkpoint_database(self):
+        """Flush the write-ahead log into the main database file so the file can be copied safely."""
+        self.get_db_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def data_version(self):
+        """
+        Return a value that changes whenever the database is written, for invalidating caches of query results.
+
+        Combines this thread's own change count with SQLite's data_version, which changes when any other
+        connection commits. Both restart when the connection is reopened, so callers that cache across
+        close_db_connection must clear their cache themselves.
+        """
+        conn = self.get_db_connection()
+        return conn.total_changes, conn.execute("PRAGMA data_version").fetchone()[0]
 
     def add_transaction(self, transaction_type, amount, date, category, tag=None):
         """
@@ -124,7 +493,7 @@ class TreasureGoblin:
 
         Parameters:
             transaction_type (str): Type of transaction ('income' or 'expense')
-            amount (float): Transaction amount
+            amount (float): Transaction amount in dollars
             date (str or datetime): Transaction date in ('MM-DD-YYYY' format if string)
             category (str): Transaction category name
             tag (str, optional): Optional tag for the transaction
@@ -132,6 +501,124 @@ class TreasureGoblin:
         Returns:
             int: ID of the newly created transaction, or None if failed
         """
+        amount, date = self._normalize_transaction(transaction_type, amount, date)
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            with self.write_transaction():
+                category_id = self._get_category_id(cursor, category, transaction_type)
+                transaction_id = self._add_transaction_fast(transaction_type, amount, date, category_id, tag)
+
+            # Only cache the category once the transaction has committed
+            self._cache_category(category, transaction_type, category_id)
+            return transaction_id
+
+        except sqlite3.Error as e:
+            # The with block has already rolled back the transaction
+            print(f"Database error: {e}")
+            return None
+
+    def _add_transaction_fast(self, transaction_type, amount_cents, iso_date, category_id, tag):
+        """
+        Insert a transaction whose fields have already been validated and converted.
+
+        No checks or conversions are done here, and the caller owns the surrounding database transaction.
+
+        Returns:
+            int: ID of the newly created transaction
+        """
+        cursor = self.get_db_connection().execute(
+            INSERT_TRANSACTION_SQL, (transaction_type, amount_cents, iso_date, category_id, tag)
+        )
+        return cursor.lastrowid
+
+    def update_transaction(self, transaction_id, transaction_type, amount, date, category, tag=None):
+        """
+        Update an existing transaction.
+
+        Parameters:
+            transaction_id (int): ID of the transaction to update
+            transaction_type, amount, date, category, tag: New values, in the same formats accepted by
+                add_transaction
+
+        Returns:
+            bool: True if the transaction was updated, False if failed
+        """
+        amount, date = self._normalize_transaction(transaction_type, amount, date)
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            with self.write_transaction():
+                category_id = self._get_category_id(cursor, category, transaction_type)
+                cursor.execute('''
+                    UPDATE transactions
+                    SET type = ?, amount = ?, date = ?, category_id = ?, tag = ?
+                    WHERE id = ?
+                ''', (transaction_type, amount, date, category_id, tag, transaction_id))
+
+            self._cache_category(category, transaction_type, category_id)
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return False
+
+    def add_transactions_bulk(self, rows):
+        """
+        Add many transactions in a single database transaction.
+
+        Parameters:
+            rows (iterable): (transaction_type, amount, date, category, tag) tuples, in the same formats
+                accepted by add_transaction
+
+        Returns:
+            int: Number of transactions added, or None if failed (in which case none are added)
+        """
+        # Validate everything up front so a bad row can't leave a half-written import
+        normalized_rows = []
+        for transaction_type, amount, date, category, tag in rows:
+            amount, date = self._normalize_transaction(transaction_type, amount, date)
+            normalized_rows.append((transaction_type, amount, date, category, tag))
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+        new_categories = {}
+
+        try:
+            with self.write_transaction():
+                # Resolve every category before inserting so the rows can be inserted in batches
+                insert_rows = []
+                for transaction_type, amount, date, category, tag in normalized_rows:
+                    key = (category, transaction_type)
+                    category_id = new_categories.get(key)
+                    if category_id is None:
+                        category_id = self._get_category_id(cursor, category, transaction_type)
+                        new_categories[key] = category_id
+
+                    insert_rows.append((transaction_type, amount, date, category_id, tag))
+
+                insert_transactions(cursor, insert_rows)
+
+            for (category, transaction_type), category_id in new_categories.items():
+                self._cache_category(category, transaction_type, category_id)
+            return len(insert_rows)
+
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+
+    def _normalize_transaction(self, transaction_type, amount, date):
+        """
+        Validate a transaction's fields and convert them to their stored form.
+
+        Returns:
+            tuple: (amount_cents, iso_date) with the amount made positive and converted to integer cents, and the
+            date as a 'YYYY-MM-DD' string
+        """
         # Validate transaction type
         if transaction_type not in ['income', 'expense']:
             raise ValueError("Transaction type must be either 'income' or 'expense'")
@@ -144,45 +631,29 @@ class TreasureGoblin:
                 raise ValueError("Date must be in 'MM-DD-YYYY' format")
 
         # Make sure amount is positive
-        amount = abs(float(amount))
+        return to_cents(abs(float(amount))), date.isoformat()
 
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
+    def _get_category_id(self, cursor, category, transaction_type):
+        """Get a category's ID, only going to the database on a cache miss and creating it if it doesn't exist."""
+        category_id = self._category_cache.get((category, transaction_type))
+        if category_id is not None:
+            return category_id
 
-        try:
-            # Get category ID
-            cursor.execute(
-                "SELECT id FROM categories WHERE name = ? AND type = ?",
-                (category, transaction_type)
-            )
-            category_result = cursor.fetchone()
-
-            if not category_result:
-                # Category doesn't exist, create it
-                cursor.execute(
-                    "INSERT INTO categories (name, type) VALUES (?, ?)",
-                    (category, transaction_type)
-                )
-                category_id = cursor.lastrowid
-            else:
-                category_id = category_result[0]
-
-            # Insert transaction
-            cursor.execute('''
-                INSERT INTO transactions (type, amount, date, category_id, tag)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (transaction_type, amount, date.isoformat(), category_id, tag))
-
-            transaction_id = cursor.lastrowid
-            conn.commit()
-            return transaction_id
+        cursor.execute(
+            "SELECT id FROM categories WHERE name = ? AND type = ?",
+            (category, transaction_type)
+        )
+        category_result = cursor.fetchone()
 
-        except sqlite3.Error as e:
-            conn.rollback()
-            print(f"Database error: {e}")
-            return None
-        finally:
-            conn.close()
+        if category_result:
+            return category_result[0]
+
+        # Category doesn't exist, create it
+        cursor.execute(
+            "INSERT INTO categories (name, type) VALUES (?, ?)",
+            (category, transaction_type)
+        )
+        return cursor.lastrowid
 
     def get_transactions(self, month=None, year=None, limit=None):
         """
@@ -196,62 +667,138 @@ class TreasureGoblin:
         Returns:
             list: List of transaction dictionaries with all details
         """
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
+        return [dict(row) for row in self.iter_transactions(month, year, limit)]
+
+    def iter_transactions(self, month=None, year=None, limit=None):
+        """
+        Iterate over transactions with optional filtering by month and year, newest first.
 
+        Rows are fetched from the cursor as they are consumed, so callers that stop early never load the rest.
+        Takes the same parameters as get_transactions.
+
+        Yields:
+            sqlite3.Row: Transaction details, accessible by column name like a read-only dict
+        """
         query = """
-            SELECT t.id, t.type, t.amount, t.date, c.name as category, t.tag
+            SELECT t.id, t.type, t.amount / 100.0 as amount, t.date, c.name as category, t.tag
             FROM transactions t
             JOIN categories c ON t.category_id = c.id
         """
 
         params = []
 
-        # Add date filtering if specified
+        # Add date filtering if specified (ISO dates sort lexicographically, so ranges can use the date index)
         if month and year:
-            query += " WHERE strftime('%m', t.date) = ? AND strftime('%Y', t.date) = ?"
-            params.extend([f"{month:02d}", f"{year}"])
+            query += " WHERE t.date >= ? AND t.date < ?"
+            params.extend(month_bounds(year, month))
         elif month:
-            query += " WHERE strftime('%m', t.date) = ?"
+            # Dates are stored as 'YYYY-MM-DD', so the month can be sliced out without parsing the date
+            query += " WHERE substr(t.date, 6, 2) = ?"
             params.append(f"{month:02d}")
         elif year:
-            query += " WHERE strftime('%Y', t.date) = ?"
-            params.append(f"{year}")
+            query += " WHERE t.date >= ? AND t.date < ?"
+            params.extend([f"{year}-01-01", f"{year + 1}-01-01"])
 
-        # Order by date descending (newest first)
-        query += " ORDER BY t.date DESC"
+        # Order by date descending (newest first). LIMIT is always bound, with -1 meaning no limit,
+        # so every call with the same filter reuses one cached statement
+        query += " ORDER BY t.date DESC, t.id DESC LIMIT ?"
+        params.append(int(limit) if limit else -1)
 
-        # Add limit if specified
-        if limit:
-            query += f" LIMIT {limit}"
+        # Close the cursor and return the connection even if the caller abandons the generator part way through
+        with self.read_connection() as conn, closing(conn.execute(query, params)) as cursor:
+            yield from cursor
 
-        cursor.execute(query, params)
+    def get_dashboard_summary(self, year, month, conn=None):
+        """
+        Get the totals and recent transactions shown on the dashboard.
 
-        # Convert to list of dictionaries
-        columns = [column[0] for column in cursor.description]
-        transactions = []
+        Parameters:
+            year (int): Year of the current month
+            month (int): Current month (1-12), compared against the month before it
+            conn (sqlite3.Connection, optional): Connection to read with, defaults to a pooled reader
 
-        for row in cursor.fetchall():
-            transaction = dict(zip(columns, row))
-            transactions.append(transaction)
+        Returns:
+            dict: total_balance, current_income, current_expenses and previous_net in dollars,
+            recent_transactions, a list of the five newest transaction dictionaries, and the year, month,
+            previous_year and previous_month the figures are for
+        """
+        if conn is None:
+            with self.read_connection() as conn:
+                return self.get_dashboard_summary(year, month, conn)
 
-        conn.close()
-        return transactions
+        previous_year, previous_month = (year - 1, 12) if month == 1 else (year, month - 1)
 
-    def get_no_category_id(self, transaction_type):
-        """Get the ID of the {NO_CATEGORY} for the specified transaction type."""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
+        summary = conn.execute(DASHBOARD_SUMMARY_SQL, {
+            'current_month': f"{year}-{month:02d}",
+            'previous_month': f"{previous_year}-{previous_month:02d}"
+        }).fetchone()
 
-        cursor.execute(
-            "SELECT id FROM categories WHERE name = '{NO_CATEGORY}' AND type = ?",
-            (transaction_type,)
-        )
-        result = cursor.fetchone()
-        conn.close()
+        # The sums are exact integer cents (NULL for empty months), converted to dollars only once here
+        data = {key: (summary[key] or 0) / 100 for key in summary.keys()}
 
-        if result:
-            return result[0]
-        else:
+        data['recent_transactions'] = [dict(row) for row in conn.execute(RECENT_TRANSACTIONS_SQL, (self.RECENT_TRANSACTION_COUNT,))]
+        data['year'] = year
+        data['month'] = month
+        data['previous_year'] = previous_year
+        data['previous_month'] = previous_month
+
+        return data
+
+    def get_transaction_months(self):
+        """
+        Get every month that has transactions, newest first.
+
+        Returns:
+            list: (year, month) integer tuples
+        """
+        # The monthly totals are keyed by 'YYYY-MM' first, so this walks a handful of rows per month in order
+        with self.read_connection() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT month FROM transaction_monthly_totals ORDER BY month DESC"
+            ).fetchall()
+        return [(int(year_month[:4]), int(year_month[5:7])) for (year_month,) in rows]
+
+    def get_transaction_years(self):
+        """Get every year that has transactions, newest first."""
+        with self.read_connection() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT substr(month, 1, 4) as year FROM transaction_monthly_totals ORDER BY year DESC"
+            ).fetchall()
+        return [int(year) for (year,) in rows]
+
+    def get_category_totals(self, transaction_type, start_month, end_month):
+        """
+        Get the total of each category for a type over a range of whole months, largest first.
+
+        Reads the per-month totals rather than the transactions, so the cost depends on the number of months and
+        categories in the range. {NO_CATEGORY} is left out.
+
+        Parameters:
+            transaction_type (str): 'income' or 'expense'
+            start_month (str): First month of the range, as 'YYYY-MM'
+            end_month (str): Last month of the range (inclusive), as 'YYYY-MM'
+
+        Returns:
+            list: (category, total) rows with the total in dollars
+        """
+        with self.read_connection() as conn:
+            return conn.execute('''
+                SELECT c.name as category, SUM(m.total) / 100.0 as total
+                FROM transaction_monthly_totals m
+                JOIN categories c ON m.category_id = c.id
+                WHERE m.type = ? AND m.month >= ? AND m.month <= ? AND c.name != '{NO_CATEGORY}'
+                GROUP BY c.name
+                ORDER BY total DESC
+            ''', (transaction_type, start_month, end_month)).fetchall()
+
+    def get_category_names(self, transaction_type):
+        """Get the names of the user-selectable (non-system) categories of a type, in alphabetical order."""
+        return list(self._categories_by_type.get(transaction_type, ()))
+
+    def get_no_category_id(self, transaction_type):
+        """Get the ID of the {NO_CATEGORY} for the specified transaction type."""
+        try:
+            return self._no_category_ids[transaction_type]
+        except KeyError:
             # This should never happen if setup_database ran correctly
             raise Exception(f"System category {{NO_CATEGORY}} not found for type {transaction_type}")
@@ -1,52 +1,125 @@
-from datetime import datetime, timedelta
+import calendar
+from datetime import datetime
 import json
 import shutil
 import sqlite3
 import sys
 import tempfile
+import traceback
 import uuid
 import zipfile
 import random
 import os
-import matplotlib
-matplotlib.use('Qt5Agg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QPushButton, QTextEdit,
-                             QListWidget, QCalendarWidget, QFileDialog,
+                             QListWidget, QListView, QCalendarWidget, QFileDialog,
                              QFormLayout, QGroupBox, QSplitter, QTabWidget,
                              QMessageBox, QComboBox, QScrollArea, QFrame, QLineEdit, 
                              QDateEdit, QDateTimeEdit, QSpinBox, QListWidgetItem, QGridLayout, QInputDialog,
                              QMenu, QFileDialog, QDialog, QCheckBox, QProgressBar, QFrame, QGraphicsDropShadowEffect,
-                             QHBoxLayout, QVBoxLayout)
-from PyQt5.QtCore import Qt, QDate, QDateTime, QObject, pyqtSignal, QTimer, QThread, QPropertyAnimation, QEasingCurve
+                             QHBoxLayout, QVBoxLayout, QStackedWidget)
+from PyQt5.QtCore import (Qt, QDate, QDateTime, QObject, pyqtSignal, QTimer, QThread, QPropertyAnimation, QEasingCurve,
+                          QRunnable, QThreadPool, QLocale)
 from PyQt5.QtGui import QIcon, QFont, QPixmap, QPalette, QColor, QLinearGradient, QPainter, QBrush
 from pathlib import Path
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
 import webbrowser
 import threading
 
 # TreasureGoblin modules
 from theme import TreasureGoblinTheme
 from ui.components import (GoblinCard, TreasureButton, MoneyDisplay,
-                           CategoryButton, TransactionItemWidget)
-from core.models import TreasureGoblin
+                           CategoryButton, TransactionListModel, TransactionItemDelegate)
+from core.models import TreasureGoblin, month_bounds, to_cents
 from services.google_drive import GoogleDriveSync, GoogleDriveSyncDialog
 from utils.import_export import TreasureGoblinImportExport
 
+class DashboardWorkerSignals(QObject):
+    """Signals for DashboardWorker, which can't define its own since QRunnable isn't a QObject"""
+    results_ready = pyqtSignal(dict)
+
+
+class DashboardWorker(QRunnable):
+    """Reads the dashboard data on a thread pool thread so the window doesn't block on the database"""
+
+    def __init__(self, treasure_goblin, year, month):
+        super().__init__()
+        self.treasure_goblin = treasure_goblin
+        self.year = year
+        self.month = month
+        self.signals = DashboardWorkerSignals()
+
+    def run(self):
+        try:
+            # Reads through a pooled read-only connection, so it never waits on the UI thread's writes
+            data = self.treasure_goblin.get_dashboard_summary(self.year, self.month)
+        except sqlite3.Error as e:
+            print(f"Error updating dashboard: {e}")
+            return
+
+        self.signals.results_ready.emit(data)
+
+
+class ExportWorkerSignals(QObject):
+    """Signals for ExportWorker, which can't define its own since QRunnable isn't a QObject"""
+    finished = pyqtSignal(bool, str)
+
+
+class ExportWorker(QRunnable):
+    """Snapshots and compresses the database on a thread pool thread so the window stays responsive"""
+
+    def __init__(self, import_export, export_file):
+        super().__init__()
+        self.import_export = import_export
+        self.export_file = export_file
+        self.signals = ExportWorkerSignals()
+
+    def run(self):
+        success, message = self.import_export.export_database(self.export_file)
+        self.signals.finished.emit(success, message)
+
+
+class ImportWorkerSignals(QObject):
+    """Signals for ImportWorker, which can't define its own since QRunnable isn't a QObject"""
+    finished = pyqtSignal(bool, str)
+
+
+class ImportWorker(QRunnable):
+    """Merges an exported archive into the database on a thread pool thread so the window stays responsive"""
+
+    def __init__(self, import_export, import_file):
+        super().__init__()
+        self.import_export = import_export
+        self.import_file = import_file
+        self.signals = ImportWorkerSignals()
+
+    def run(self):
+        success, message = self.import_export.import_database(self.import_file, merge=True)
+        self.signals.finished.emit(success, message)
+
+
 class TreasureGoblinApp (QMainWindow):
     """Main application window for TreasureGoblin"""
+
+    # Month-over-month difference label styles for a gain (True) and a loss (False), built once
+    DIFFERENCE_STYLES = {
+        True: f"color: {TreasureGoblinTheme.COLORS['success_light']}; font-size: 16px; font-weight: bold;",
+        False: f"color: {TreasureGoblinTheme.COLORS['danger_light']}; font-size: 16px; font-weight: bold;"
+    }
+
     def __init__(self, treasuregoblin):
         super().__init__()
 
         self.treasure_goblin = treasuregoblin
+
+        # Database reads run on a pool of our own: Qt's global pool is used internally (e.g. by image loading)
+        # while the GUI thread holds the GIL, so a Python worker waiting for the GIL there can deadlock it.
+        # One thread also keeps dashboard refreshes in order.
+        self.db_thread_pool = QThreadPool(self)
+        self.db_thread_pool.setMaxThreadCount(1)
+
+        # Figures last shown on the dashboard, or None while a DashboardWorker is reading new ones
+        self.dashboard_data = None
+
         self.init_nibble_tips()
         self.init_ui()
 
@@ -125,11 +198,13 @@ class TreasureGoblinApp (QMainWindow):
 
             main_layout.addWidget(self.tabs)
 
-            # Create individual tabs
+            # Create individual tabs. Categories and Reports start as empty pages and are built by build_tab the
+            # first time they're opened, so their widgets and matplotlib don't add to startup time
             self.dashboard_tab = self.create_dashboard_tab()
             self.create_transactions_tab = self.create_transactions_tab()
-            self.categories_tab = self.create_categories_tab()
-            self.reports_tab = self.create_reports_tab()
+            self.categories_tab = QWidget()
+            self.reports_tab = QWidget()
+            self.unbuilt_tabs = {2: self.create_categories_tab, 3: self.create_reports_tab}
 
             # Add tabs to the tab widget
             self.tabs.addTab(self.dashboard_tab, "Dashboard")
@@ -166,8 +241,18 @@ class TreasureGoblinApp (QMainWindow):
         """Relay database connection to the data manager."""
         return self.treasure_goblin.get_db_connection()
     
+    def build_tab(self, index):
+        """Fill in the contents of a tab that was added as an empty page, the first time it's opened."""
+        create_tab = self.unbuilt_tabs.pop(index, None)
+        if create_tab is not None:
+            layout = QVBoxLayout(self.tabs.widget(index))
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(create_tab())
+
     def handle_tab_changed(self, index):
         """Handle actions when tabs are changed."""
+        self.build_tab(index)
+
         # When switching to transactions tab (index 1), update category options
         if index == 1:
             # Update category options for the form
@@ -186,7 +271,7 @@ class TreasureGoblinApp (QMainWindow):
         # When switching to reports tab (index 3), refresh the period selector
         elif index == 3:
             # Refresh the reports period selector in case new data was added
-            self.populate_month_selector()
+            self.populate_report_period_selector()
 
     def create_dashboard_tab(self):
         """Create the dashboard tab with summary information."""
@@ -296,8 +381,9 @@ class TreasureGoblinApp (QMainWindow):
         comparison_box.setFrameStyle(QFrame.StyledPanel)
         comparison_layout = QVBoxLayout(comparison_box)
         
-        current_month = datetime.now().strftime("%B")
-        last_month = (datetime.now().replace(day=1) - timedelta(days=1)).strftime("%B")
+        month = datetime.now().month
+        current_month = calendar.month_name[month]
+        last_month = calendar.month_name[month - 1 or 12]
         
         self.comparison_title = QLabel(f"{current_month} compared to {last_month}:")
         self.comparison_title.setAlignment(Qt.AlignCenter)
@@ -344,10 +430,14 @@ class TreasureGoblinApp (QMainWindow):
         """)
         recent_layout = QVBoxLayout(recent_group)
         
-        self.transactions_list = QListWidget()
+        self.transactions_list = QListView()
         self.transactions_list.setMaximumHeight(250)
+        self.transactions_list.setMouseTracking(True)
+        self.recent_transactions_model = TransactionListModel(self)
+        self.transactions_list.setModel(self.recent_transactions_model)
+        self.transactions_list.setItemDelegate(TransactionItemDelegate(parent=self.transactions_list))
         self.transactions_list.setStyleSheet(f"""
-            QListWidget {{
+            QListView {{
                 background-color: {TreasureGoblinTheme.COLORS['surface']};
                 border: none;
                 border-radius: 0px;
@@ -355,26 +445,6 @@ class TreasureGoblinApp (QMainWindow):
                 outline: none;
                 font-size: 14px;
             }}
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-                margin: 3px 0;
-                min-height: 35px;
-            }}
-            QListWidget::item:selected {{
-                background-color: rgba(45, 106, 79, 0.3);
-                border: none;
-            }}
-            QListWidget::item:hover {{
-                background-color: rgba(45, 106, 79, 0.15);
-                border: none;
-            }}
-            QListWidget::item:focus {{
-                outline: none;
-                border: none;
-            }}
         """)
         recent_layout.addWidget(self.transactions_list)
         layout.addWidget(recent_group)
@@ -486,67 +556,42 @@ class TreasureGoblinApp (QMainWindow):
         self.update_nibble()
     
     def update_dashboard(self):
-        """Update dashboard with the latest data from the database."""
-        try:
-            # Get current and previous month info
-            now = datetime.now()
-            current_month = now.month
-            current_year = now.year
-
-            # Calculate previous month
-            if current_month == 1: # January
-                previous_month = 12
-                previous_year = current_year - 1
-            else:
-                previous_month = current_month - 1
-                previous_year = current_year
+        """Update dashboard with the latest data from the database, read on a worker thread."""
+        now = datetime.now()
 
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
+        self.dashboard_data = None
+        worker = DashboardWorker(self.treasure_goblin, now.year, now.month)
+        worker.signals.results_ready.connect(self.apply_dashboard)
+        # Keep the worker referenced until it has run
+        self.dashboard_worker = worker
+        self.db_thread_pool.start(worker)
 
-            # Calculate total balance
-            cursor.execute("""
-                SELECT
-                    SUM(CASE WHEN type = 'income' THEN amount ELSE 0 END) -
-                    SUM(CASE WHEN type = 'expense' THEN amount ELSE 0 END)
-                FROM transactions
-            """)
+        # Update Nibble with a new tip and image
+        self.update_nibble()
+
+    def apply_dashboard(self, data):
+        """Show dashboard data read by a DashboardWorker."""
+        self.dashboard_data = data
+        self.show_dashboard_totals()
+        self.recent_transactions_model.set_transactions(data['recent_transactions'])
 
-            total_balance = cursor.fetchone()[0] or 0
-            self.balance_amount.setText(f"$ {total_balance:.2f}")
-
-            # Calculate current month income and expenses
-            cursor.execute("""
-                SELECT
-                    SUM(CASE WHEN type = 'income' THEN amount ELSE 0 END) as income,
-                    SUM(CASE WHEN type = 'expense' THEN amount ELSE 0 END) as expenses
-                FROM transactions
-                WHERE strftime('%m', date) = ? AND strftime('%Y', date) = ?
-            """, (f"{current_month:02d}", str(current_year)))
-
-            current_income, current_expenses = cursor.fetchone()
-            current_income = current_income or 0
-            current_expenses = current_expenses or 0
+    def show_dashboard_totals(self):
+        """Show the balance and monthly figures in self.dashboard_data."""
+        data = self.dashboard_data
+        try:
+            current_income = data['current_income']
+            current_expenses = data['current_expenses']
+            previous_net = data['previous_net']
             current_net = current_income - current_expenses
 
+            self.balance_amount.setText(f"$ {data['total_balance']:.2f}")
             self.month_income.setText(f"$ {current_income:.2f}")
             self.month_expenses.setText(f"$ {current_expenses:.2f}")
             self.month_net.setText(f"$ {current_net:.2f}")
 
-            # Calculate the previous months income and expenses
-            cursor.execute("""
-                SELECT
-                    SUM(CASE WHEN type = 'income' THEN amount ELSE 0 END) -
-                    SUM(CASE WHEN type = 'expense' THEN amount ELSE 0 END) as net
-                FROM transactions
-                WHERE strftime('%m', date) = ? AND strftime('%Y', date) = ?
-            """, (f"{previous_month:02d}", str(previous_year)))
-
-            previous_net = cursor.fetchone()[0] or 0
-
             # Update month comparison section
-            current_month_name = now.strftime("%B")
-            previous_month_name = datetime(previous_year, previous_month, 1).strftime("%B")
+            current_month_name = calendar.month_name[data['month']]
+            previous_month_name = calendar.month_name[data['previous_month']]
 
             self.comparison_title.setText(f"{current_month_name} compared to {previous_month_name}:")
             self.prev_month_label.setText(f"{previous_month_name}: $ {previous_net:.2f}")
@@ -558,99 +603,47 @@ class TreasureGoblinApp (QMainWindow):
             if previous_net != 0:
                 percentage = (difference / abs(previous_net)) * 100
 
-            # Set color based on whether the difference is positive or negative
-            color = TreasureGoblinTheme.COLORS['success_light'] if difference >= 0 else TreasureGoblinTheme.COLORS['danger_light']
+            # Set color based on whether the difference is positive or negative. Qt re-parses and re-polishes on
+            # every setStyleSheet call, so it's only called when the sign changes.
             self.difference_label.setText(f"$ {difference:.2f} ({percentage:.2f}%)")
-            self.difference_label.setStyleSheet(f"color: {color}; font-size: 16px; font-weight: bold;")
-
+            style = self.DIFFERENCE_STYLES[difference >= 0]
+            if self.difference_label.styleSheet() != style:
+                self.difference_label.setStyleSheet(style)
 
-            # Get recent transactions
-            cursor.execute("""
-                SELECT t.date, t.amount, t.type, c.name, t.tag
-                FROM transactions t
-                JOIN categories c ON t.category_id = c.id
-                ORDER BY t.date DESC
-                LIMIT 5
-            """)
-
-            recent_transactions = cursor.fetchall()
-
-            # Clear and repopulate transactions list
-            self.transactions_list.clear()
-
-            for transaction in recent_transactions:
-                date, amount, type, category, tag = transaction
-                date_obj = datetime.fromisoformat(date).strftime("%m/%d/%y")
-
-                description = category
-                if tag:
-                    description += f" ({tag})"
-                
-                 # Create item
-                item = QListWidgetItem()
-                
-                # Create container widget
-                item_widget = QWidget()
-                item_layout = QHBoxLayout(item_widget)
-                item_layout.setContentsMargins(10, 8, 10, 8)
-
-                # Date label
-                date_label = QLabel(date_obj)
-                date_label.setStyleSheet(f"""
-                color: {TreasureGoblinTheme.COLORS['text_secondary']};
-                font-size: 14px;
-                min-width: 65px;
-                font-weight: bold;
-            """)
-                item_layout.addWidget(date_label)
-
-                # Description label
-                desc_label = QLabel(description)
-                desc_label.setStyleSheet(f"""
-                color: {TreasureGoblinTheme.COLORS['text_primary']};
-                font-size: 14px;
-                padding-left: 10px;
-                font-weight: bold;
-            """)
-                item_layout.addWidget(desc_label)
-
-                # Spacer
-                item_layout.addStretch()
-
-                # Amount label
-                if type == 'income':
-                    amount_color = TreasureGoblinTheme.COLORS['success_light']  # Green for income
-                else:
-                    amount_color = TreasureGoblinTheme.COLORS['danger_light']   # Red for expenses
+        except Exception as e:
+            print(f"Error updating dashboard: {e}")
 
-                amount_label = QLabel(f"${amount:.2f}")
-                amount_label.setStyleSheet(f"""
-                    color: {amount_color};
-                    font-weight: bold;
-                    font-family: Consolas;
-                    font-size: 16px;
-                    min-width: 80px;
-                    text-align: right;
-                """)
-                amount_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                item_layout.addWidget(amount_label)
+    def apply_transaction_to_dashboard(self, transaction, data):
+        """
+        Add a newly saved transaction to the dashboard figures without re-reading the database.
 
-                # Set the widget size
-                item_widget.setMinimumHeight(40)
+        data is the dashboard_data that was shown when the transaction was saved. If a refresh has replaced it
+        since, that refresh read the database after the save and already includes the transaction.
+        """
+        if data is None or self.dashboard_data is not data:
+            return
 
-                # Add to list
-                self.transactions_list.addItem(item)
-                self.transactions_list.setItemWidget(item, item_widget)
+        amount = transaction['amount']
+        signed_amount = amount if transaction['type'] == 'income' else -amount
+        date = transaction['date']
 
-                item.setSizeHint(item_widget.sizeHint())
+        data['total_balance'] = round(data['total_balance'] + signed_amount, 2)
 
-            conn.close()
+        current_start, current_end = month_bounds(data['year'], data['month'])
+        previous_start, previous_end = month_bounds(data['previous_year'], data['previous_month'])
+        if current_start <= date < current_end:
+            key = 'current_income' if transaction['type'] == 'income' else 'current_expenses'
+            data[key] = round(data[key] + amount, 2)
+        elif previous_start <= date < previous_end:
+            data['previous_net'] = round(data['previous_net'] + signed_amount, 2)
 
-            # Update Nibble with a new tip and image
-            self.update_nibble()
+        self.show_dashboard_totals()
+        self.recent_transactions_model.insert_transaction(
+            transaction, limit=self.treasure_goblin.RECENT_TRANSACTION_COUNT
+        )
 
-        except Exception as e:
-            print(f"Error updating dashboard: {e}")
+        # Update Nibble with a new tip and image, as a full refresh would
+        self.update_nibble()
 
     def create_transactions_tab(self):
         """Create the transactions tab with transaction entry form and history."""
@@ -708,12 +701,19 @@ class TreasureGoblinApp (QMainWindow):
         self.month_combo.currentIndexChanged.connect(self.load_transactions_for_month)
         
         # Transactions list with selection functionality
-        self.transactions_list_widget = QListWidget()
+        self.transactions_list_widget = QListView()
         self.transactions_list_widget.setMinimumWidth(300)
-        self.transactions_list_widget.setSelectionMode(QListWidget.SingleSelection)
-        self.transactions_list_widget.setSelectionBehavior(QListWidget.SelectRows)
+        self.transactions_list_widget.setSelectionMode(QListView.SingleSelection)
+        self.transactions_list_widget.setSelectionBehavior(QListView.SelectRows)
+        self.transactions_list_widget.setMouseTracking(True)
+        self.transactions_model = TransactionListModel(self)
+        self.transactions_list_widget.setModel(self.transactions_model)
+        self.transactions_list_widget.setItemDelegate(TransactionItemDelegate(
+            font_size=16, amount_font_size=18, row_height=50, highlight_no_category=True,
+            parent=self.transactions_list_widget
+        ))
         self.transactions_list_widget.setStyleSheet(f"""
-            QListWidget {{
+            QListView {{
                 background-color: {TreasureGoblinTheme.COLORS['surface']};
                 border: 2px solid {TreasureGoblinTheme.COLORS['primary_dark']};
                 border-radius: 8px;
@@ -721,30 +721,12 @@ class TreasureGoblinApp (QMainWindow):
                 outline: none;
                 font-size: 15px;
             }}
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-                margin: 3px 0;
-                min-height: 35px;
-            }}
-            QListWidget::item:selected {{
-                background-color: rgba(45, 106, 79, 0.3);
-                border: none;
-            }}
-            QListWidget::item:hover {{
-                background-color: rgba(45, 106, 79, 0.15);
-                border: none;
-            }}
-            QListWidget::item:focus {{
-                outline: none;
-                border: none;
-            }}
         """)
         
         # Connect selection change to update button states
-        self.transactions_list_widget.itemSelectionChanged.connect(self.on_transaction_selection_changed)
+        self.transactions_list_widget.selectionModel().selectionChanged.connect(
+            lambda selected, deselected: self.on_transaction_selection_changed()
+        )
         
         transactions_list_layout.addWidget(self.transactions_list_widget)
 
@@ -1102,6 +1084,14 @@ class TreasureGoblinApp (QMainWindow):
 
         # Initialize edit mode tracking
         self.editing_transaction_id = None
+
+        # Undo button shown in the status bar while the "added" message for the last transaction is up
+        self.last_added_transaction_id = None
+        self.undo_add_button = QPushButton("Undo")
+        self.undo_add_button.setVisible(False)
+        self.undo_add_button.clicked.connect(self.undo_last_added_transaction)
+        self.statusBar().addPermanentWidget(self.undo_add_button)
+        self.statusBar().messageChanged.connect(self.on_status_message_changed)
         
         # Initialize the category options based on the default transaction type
         self.update_category_options()
@@ -1113,35 +1103,18 @@ class TreasureGoblinApp (QMainWindow):
     
     def populate_month_selector(self):
         """Populate the month selector with only months that have transaction data."""
+        # Callers reload the transaction list themselves, so don't let clear()/addItem() trigger extra reloads
+        self.month_combo.blockSignals(True)
         self.month_combo.clear()
 
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-
-            # Get all unique year-month combination from transactions
-            query = """
-                SELECT DISTINCT
-                    strftime('%Y', date) as year,
-                    strftime('%m', date) as month,
-                    strftime('%Y-%m', date) as year_month
-                FROM transactions
-                ORDER BY year_month DESC    
-            """
-
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            # Add each month-year combination to the dropdown
-            for year, month, year_month in results:
-                # Conver to readable format
-                date_obj = datetime.strptime(f"{year}-{month}-01", "%Y-%m-%d")
-                display_text = date_obj.strftime("%B %Y")
+            # Add each month that has transactions to the dropdown
+            for year, month in self.treasure_goblin.get_transaction_months():
+                # Convert to readable format
+                display_text = datetime(year, month, 1).strftime("%B %Y")
 
                 # Add to combo box with month and year as data
-                self.month_combo.addItem(display_text, (int(month), int(year)))
-
-            conn.close()
+                self.month_combo.addItem(display_text, (month, year))
 
             # If no transactions exist, add current month as default
             if self.month_combo.count() == 0:
@@ -1155,6 +1128,10 @@ class TreasureGoblinApp (QMainWindow):
             current_date = QDate.currentDate()
             current_month_text = current_date.toString("MMMM yyyy")
             self.month_combo.addItem(current_month_text, (current_date.month(), current_date.year()))
+
+        finally:
+            # Re-enable signals
+            self.month_combo.blockSignals(False)
     
     def update_category_options(self):
         """Update category dropdown based on selected transaction type."""
@@ -1163,27 +1140,15 @@ class TreasureGoblinApp (QMainWindow):
         # Get transaction type (conver to lowercase for database query)
         transaction_type = self.transaction_type_combo.currentText().lower()
 
-        # Get categories from database (exclude system categories)
+        # Get categories from the in-memory cache (system categories are already excluded)
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                "SELECT name FROM categories WHERE type = ? AND (is_system IS NULL OR is_system = FALSE) ORDER BY name",
-                (transaction_type,)
-            )
-
-            categories = [row[0] for row in cursor.fetchall()]
-            self.category_combo.addItems(categories)
+            self.category_combo.addItems(self.treasure_goblin.get_category_names(transaction_type))
 
-            conn.close()
         except Exception as e:
             print(f"Error loading categories: {e}")
     
     def load_transactions_for_month(self):
         """Load transactions for the selected month and year."""
-        self.transactions_list_widget.clear()
-
         # Get selected month and year
         current_index = self.month_combo.currentIndex()
         if current_index >= 0:
@@ -1195,142 +1160,20 @@ class TreasureGoblinApp (QMainWindow):
 
         try:
             # Get transactions for the selected month
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT t.id, t.date, t.amount, t.type, c.name as category, t.tag
-                FROM transactions t 
-                JOIN categories c ON t.category_id = c.id 
-                WHERE strftime('%m', t.date) = ? AND strftime('%Y', t.date) = ?
-                ORDER BY t.date DESC
-            """
-
-            cursor.execute(query, (f"{month:02d}", str(year)))
-
-            transactions = []
-            for row in cursor.fetchall():
-                 id, date, amount, type, category, tag = row
-                 transactions.append({
-                     'id': id,
-                     'date': date,
-                     'amount': amount,
-                     'type': type,
-                     'category': category,
-                     'tag': tag
-                 })
-
-            conn.close()
-
-             # Add transactions to list widget
-            for transaction in transactions:
-                 # Format date
-                 date_obj = datetime.fromisoformat(transaction['date']).strftime("%m/%d/%y")
-
-                 # Format category and tag
-                 description = transaction['category']
-                 if transaction['tag']:
-                     description += f" ({transaction['tag']})"
-                
-                 # Create a custom widget item
-                 item = QListWidgetItem()
-                 item.setData(Qt.UserRole, transaction['id'])  # Store transaction ID
-
-                 # Create container widget with proper layout
-                 item_widget = TransactionItemWidget()
-                 item_layout = QHBoxLayout(item_widget)
-                 item_layout.setContentsMargins(12, 12, 12, 12)
-
-                 # Check if it's a no-category transaction
-                 if transaction['category'] == '{NO_CATEGORY}':
-                     # Warning icon for no category
-                     warning_label = QLabel("⚠️")
-                     warning_label.setStyleSheet("font-size: 16px;")
-                     item_layout.addWidget(warning_label)
-
-                # Date
-                 date_label = QLabel(date_obj)
-                 date_label.setStyleSheet(f"""
-                     color: {TreasureGoblinTheme.COLORS['text_secondary']};
-                     font-size: 16px;
-                     min-width: 75px;
-                     font-weight: bold;
-                 """)
-                 item_layout.addWidget(date_label)
-
-                 # Category and tag
-                 desc_label = QLabel(description)
-                 desc_label.setStyleSheet(f"""
-                     color: {TreasureGoblinTheme.COLORS['text_primary']};
-                     font-size: 16px;
-                     padding-left: 12px;
-                     font-weight: bold;
-                 """)
-                 item_layout.addWidget(desc_label)
-
-                 # Spacer
-                 item_layout.addStretch()
-
-                 # Amount with proprer color based on type
-                 if transaction['type'] == 'income':
-                     amount_color = TreasureGoblinTheme.COLORS['success_light'] # Green for income
-                 else:
-                    amount_color = TreasureGoblinTheme.COLORS['danger_light'] # Red for expenses
-
-                 amount_label = QLabel(f"${transaction['amount']:.2f}")
-                 amount_label.setStyleSheet(f"""
-                     color: {amount_color};
-                     font-weight: bold;
-                     font-family: Consolas;
-                     font-size: 18px;
-                     min-width: 90px;
-                     text-align: right;                    
-                 """)
-                 amount_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                 item_layout.addWidget(amount_label)
-
-                 # Set minimum height for better visibility
-                 item_widget.setMinimumHeight(50) 
-                 
-                 # Connect to list widget selection changes
-                 self.transactions_list_widget.itemSelectionChanged.connect(
-                    lambda: self.update_transaction_selection_visual()
-                 )
-
-                 # Special styling for no-category items
-                 if transaction['category'] == "{NO_CATEGORY}":
-                    item_widget.set_default_style(f"""
-                        background-color: {TreasureGoblinTheme.COLORS['surface']};
-                        border-left: 3px solid {TreasureGoblinTheme.COLORS['accent']};
-                        border-radius: 4px;                      
-                """)
-                 item_widget.setToolTip("This transaction needs a category assignment")
-
-                 # Add item to list
-                 self.transactions_list_widget.addItem(item)
-                 self.transactions_list_widget.setItemWidget(item, item_widget)
+            self.transactions_model.set_transactions(self.treasure_goblin.iter_transactions(month, year))
 
-                 # Set size hint to ensure proper display
-                 item.setSizeHint(item_widget.sizeHint()) 
-            
         except Exception as e:
+            self.transactions_model.set_transactions([])
             print(f"Error loading transactions: {e}")
 
-    def update_transaction_selection_visual(self):
-        """Update visual selection state of transaction items"""
-        for i in range(self.transactions_list_widget.count()):
-            item = self.transactions_list_widget.item(i)
-            widget = self.transactions_list_widget.itemWidget(item)
-            if isinstance(widget, TransactionItemWidget):
-                widget.set_selected(item.isSelected())
+    def selected_transaction_id(self):
+        """Get the ID of the transaction selected in the transactions list, or None if nothing is selected."""
+        selected = self.transactions_list_widget.selectionModel().selectedIndexes()
+        return selected[0].data(Qt.UserRole) if selected else None
 
     def on_transaction_selection_changed(self):
         """Handle when a transaction is selected or deselected in the list."""
-        # Get the currently selected item
-        selected_items = self.transactions_list.selectedItems()
-        current_item = self.transactions_list_widget.currentItem()
-
-        if current_item:
+        if self.selected_transaction_id() is not None:
             # A transaction is selected - enable the buttons and change their color
             self.edit_transaction_button.setEnabled(True)
             self.edit_transaction_button.setStyleSheet(f"""
@@ -1381,14 +1224,9 @@ class TreasureGoblinApp (QMainWindow):
 
     def on_edit_transaction_clicked(self):
         """Handle clicking the Edit Transaction button."""
-        # Get the currently selected item
-        current_item = self.transactions_list_widget.currentItem()
-
-        if current_item:
-            # Get the transaction ID from the current item
-            transaction_id = current_item.data(Qt.UserRole)
-            if transaction_id:
-                self.edit_transaction(transaction_id)
+        transaction_id = self.selected_transaction_id()
+        if transaction_id is not None:
+            self.edit_transaction(transaction_id)
 
     def edit_transaction(self, transaction_id):
         """Load transaction data into the form for editing"""
@@ -1398,7 +1236,7 @@ class TreasureGoblinApp (QMainWindow):
             cursor = conn.cursor()
 
             query = """
-                SELECT t.type, t.amount, t.date, t.tag, c.name as category
+                SELECT t.type, t.amount / 100.0 as amount, t.date, t.tag, c.name as category
                 FROM transactions t
                 JOIN categories c ON t.category_id = c.id
                 WHERE t.id = ?
@@ -1406,7 +1244,6 @@ class TreasureGoblinApp (QMainWindow):
 
             cursor.execute(query, (transaction_id,))
             result = cursor.fetchone()
-            conn.close()
 
             if result:
                 transaction_type, amount, date, tag, category = result
@@ -1447,14 +1284,9 @@ class TreasureGoblinApp (QMainWindow):
 
     def on_delete_transaction_clicked(self):
         """Handle clicking the Delete Transaction button."""
-        # Get the currently selected item
-        current_item = self.transactions_list_widget.currentItem()
-        
-        if current_item:
-            # Get the transaction ID from the current item
-            transaction_id = current_item.data(Qt.UserRole)
-            if transaction_id:
-                self.delete_transaction(transaction_id)
+        transaction_id = self.selected_transaction_id()
+        if transaction_id is not None:
+            self.delete_transaction(transaction_id)
     
 
     def delete_transaction(self, transaction_id):
@@ -1474,9 +1306,8 @@ class TreasureGoblinApp (QMainWindow):
                 conn = self.get_db_connection()
                 cursor = conn.cursor()
 
-                cursor.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
-                conn.commit()
-                conn.close()
+                with self.treasure_goblin.write_transaction():
+                    cursor.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
 
                 # Refresh the month selector (in case we deleted all transactions from a month)
                 self.populate_month_selector()
@@ -1492,6 +1323,39 @@ class TreasureGoblinApp (QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete transaction: {str(e)}")
 
+    def on_status_message_changed(self, message):
+        """Hide the undo button once the "added" message it belongs to leaves the status bar."""
+        if not message:
+            self.undo_add_button.setVisible(False)
+            self.last_added_transaction_id = None
+
+    def undo_last_added_transaction(self):
+        """Delete the transaction that was just added, from the status bar's Undo button."""
+        transaction_id = self.last_added_transaction_id
+        if transaction_id is None:
+            return
+        self.last_added_transaction_id = None
+        self.undo_add_button.setVisible(False)
+
+        try:
+            with self.treasure_goblin.write_transaction() as conn:
+                conn.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
+        except sqlite3.Error as e:
+            QMessageBox.warning(self, "Error", f"Failed to undo the transaction: {str(e)}")
+            return
+
+        if self.editing_transaction_id == transaction_id:
+            self.cancel_edit()
+
+        # Refresh the month selector (in case that was the month's only transaction)
+        self.populate_month_selector()
+
+        # Refresh the transactions list and dashboard
+        self.load_transactions_for_month()
+        self.update_dashboard()
+
+        self.statusBar().showMessage("Transaction removed.", 3000)
+
     def cancel_edit(self):
         """Cancel editing mode and return to add mode."""
         # Reset to add mode
@@ -1501,149 +1365,145 @@ class TreasureGoblinApp (QMainWindow):
         self.cancel_edit_button.setVisible(False)
 
         # Clear form fields
-        self.amount_input.clear()
-        self.tag_input.clear()
-        self.date_input.setDate(QDate.currentDate())
+        self.clear_transaction_fields()
         self.transaction_type_combo.setCurrentIndex(0)
         self.update_category_options()
 
         # Clear any selection in the transaction list
-        self.transactions_list_widget.setCurrentItem(None)
+        self.transactions_list_widget.clearSelection()
         
         # Manually trigger the selection changed handler to update button states
         self.on_transaction_selection_changed()
  
-    def submit_transaction(self):
-        """Handle the submission of a new or edited transaction."""
-        try:
-            # Get form values
-            transaction_type = self.transaction_type_combo.currentText().lower()
+    def clear_transaction_fields(self):
+        """Empty the amount and tag fields and set the date back to today, keeping the type and category."""
+        self.amount_input.clear()
+        self.tag_input.clear()
+        self.date_input.setDate(QDate.currentDate())
 
-            # Validate amount
-            amount_text = self.amount_input.text().strip()
-            if not amount_text:
-                QMessageBox.warning(self, "Invalid Amount", "Please enter a transaction amount.")
-                return
-            
-            try:
-                amount = float(amount_text)
-                if amount <= 0:
-                    QMessageBox.warning(self, "Invalid Amount", "Amount must be greater than zero.")
-                    return
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Amount", "Please enter a valid number for the amount.")
-                return
-            
-            # Get date in ISO format 
-            date = self.date_input.date().toString("MM-dd-yyyy")
+    def validate_transaction_form(self):
+        """
+        Check the transaction form before anything is sent to the database, warning the user about the first problem.
 
-            # Get category
-            category = self.category_combo.currentText()
-            if not category:
-                QMessageBox.warning(self, "Missing Category", "Please select a transaction category.")
-                return
-            
-            # Get tag (optional)
-            tag_text = self.tag_input.text().strip()
-            tag = tag_text if tag_text else None
-
-            if self.editing_transaction_id:
-                # Update exisiting transaction
-                success = self.update_transaction(
-                    self.editing_transaction_id, transaction_type, amount, date, category, tag
-                )
+        Returns:
+            tuple: (transaction_type, amount, date, category, tag) ready for the model, or None if the form is invalid
+        """
+        transaction_type = self.transaction_type_combo.currentText().lower()
 
-                if success:
-                    # Reset form to add mode
-                    self.cancel_edit()
+        # Validate amount
+        amount_text = self.amount_input.text().strip()
+        if not amount_text:
+            QMessageBox.warning(self, "Invalid Amount", "Please enter a transaction amount.")
+            return None
 
-                    # Refresh the month selector to include any new months
-                    self.populate_month_selector()
+        # Accept the user's locale decimal separator as well as a plain '.'
+        amount, valid = QLocale().toDouble(amount_text)
+        if not valid:
+            amount, valid = QLocale.c().toDouble(amount_text)
+        if not valid:
+            QMessageBox.warning(self, "Invalid Amount", "Please enter a valid number for the amount.")
+            return None
+        if amount <= 0:
+            QMessageBox.warning(self, "Invalid Amount", "Amount must be greater than zero.")
+            return None
 
-                    # Refresh the transactions list
-                    self.load_transactions_for_month()
+        # Get date in the format the model expects
+        date = self.date_input.date().toString("MM-dd-yyyy")
 
-                    # Update the dashboard if needed
-                    self.update_dashboard()
+        # Get category
+        category = self.category_combo.currentText()
+        if not category:
+            QMessageBox.warning(self, "Missing Category", "Please select a transaction category.")
+            return None
 
-                    QMessageBox.information(self, "Success", "Transaction updated successfully!")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to update transaction. Please try again.")
+        # Get tag (optional)
+        tag_text = self.tag_input.text().strip()
+        tag = tag_text if tag_text else None
 
-            else:
+        return transaction_type, amount, date, category, tag
 
-                # Add transaction to database
-                transaction_id = self.treasure_goblin.add_transaction(
-                    transaction_type, amount, date, category, tag
-                )
+    def submit_transaction(self):
+        """Handle the submission of a new or edited transaction."""
+        form = self.validate_transaction_form()
+        if form is None:
+            return
+        transaction_type, amount, date, category, tag = form
 
-                if transaction_id:
-                    # Clear form
-                    self.amount_input.clear()
-                    self.tag_input.clear()
-                    self.date_input.setDate(QDate.currentDate())
+        if self.editing_transaction_id:
+            # Update exisiting transaction
+            success = self.update_transaction(
+                self.editing_transaction_id, transaction_type, amount, date, category, tag
+            )
 
-                    # Refresh the transactions list
-                    self.load_transactions_for_month()
+            if success:
+                # Reset form to add mode
+                self.cancel_edit()
 
-                    # Update the dashboard if needed
-                    self.update_dashboard()
+                # Refresh the month selector to include any new months
+                self.populate_month_selector()
 
-                    QMessageBox.information(self, "Success", "Transaction added successfully!")
-                else:
-                    QMessageBox.warning(self, "Error", "Failed to add transaction. Please try again.")
+                # Refresh the transactions list
+                self.load_transactions_for_month()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"An unexpected error occurred: {str(e)}")
+                # Update the dashboard if needed
+                self.update_dashboard()
 
-    def update_transaction(self, transaction_id, transaction_type, amount, date, category, tag):
-        """Update an exisiting transaction in the database."""
-        try:
-            # Conver string date to proper format
-            if isinstance(date, str):
-                date_obj = datetime.strptime(date, '%m-%d-%Y').date()
+                QMessageBox.information(self, "Success", "Transaction updated successfully!")
             else:
-                date_obj = date
-
-            # Make sure amount is positive
-            amount = abs(float(amount))
+                QMessageBox.warning(self, "Error", "Failed to update transaction. Please try again.")
 
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
+        else:
 
-            # Get category ID
-            cursor.execute(
-                "SELECT id FROM categories WHERE name = ? AND type = ?",
-                (category, transaction_type)
+            # Add transaction to database (database errors are reported by returning None)
+            transaction_id = self.treasure_goblin.add_transaction(
+                transaction_type, amount, date, category, tag
             )
-            category_result = cursor.fetchone()
 
-            if not category_result:
-                # Category doesn't exist, create it
-                cursor.execute(
-                    "INSERT INTO categories (name, type) VALUES (?, ?)",
-                    (category, transaction_type)
-                )
-                category_id = cursor.lastrowid
-            else:
-                category_id = category_result[0]
+            if transaction_id:
+                # The row as it was stored, for updating the views in place
+                transaction = {
+                    'id': transaction_id,
+                    'type': transaction_type,
+                    'amount': to_cents(amount) / 100,
+                    'date': self.date_input.date().toString("yyyy-MM-dd"),
+                    'category': category,
+                    'tag': tag
+                }
 
-            # Update transaction
-            cursor.execute('''
-                UPDATE transactions
-                SET type = ?, amount = ?, date = ?, category_id = ?, tag = ?
-                WHERE id = ?
-            ''', (transaction_type, amount, date_obj.isoformat(), category_id, tag, transaction_id))
+                # Clear form
+                self.clear_transaction_fields()
 
-            conn.commit()
-            conn.close()
-            return True
-        
-        except Exception as e:
-            print(f"Database error: {e}")
-            if conn:
-                conn.rollback()
-                conn.close()
+                # Add the row to the transactions list if it's in the month being shown
+                selected_month = self.month_combo.currentData()
+                transaction_date = QDate.fromString(transaction['date'], "yyyy-MM-dd")
+                if selected_month == (transaction_date.month(), transaction_date.year()):
+                    self.transactions_model.insert_transaction(transaction)
+
+                # Update the dashboard once the form has been repainted: with just the new amount, or with a
+                # full refresh if a DashboardWorker was already reading and may have missed it
+                dashboard_data = self.dashboard_data
+                if dashboard_data is None:
+                    QTimer.singleShot(0, self.update_dashboard)
+                else:
+                    QTimer.singleShot(0, lambda: self.apply_transaction_to_dashboard(transaction, dashboard_data))
+
+                # Confirm in the status bar rather than a modal box, so several transactions can be
+                # entered in a row, with a button to take the transaction back out
+                self.last_added_transaction_id = transaction_id
+                self.statusBar().showMessage("Transaction added successfully!", 5000)
+                self.undo_add_button.setVisible(True)
+                self.amount_input.setFocus(Qt.OtherFocusReason)
+            else:
+                QMessageBox.warning(self, "Error", "Failed to add transaction. Please try again.")
+
+    def update_transaction(self, transaction_id, transaction_type, amount, date, category, tag):
+        """Update an exisiting transaction in the database."""
+        try:
+            return self.treasure_goblin.update_transaction(
+                transaction_id, transaction_type, amount, date, category, tag
+            )
+        except ValueError as e:
+            print(f"Invalid transaction: {e}")
             return False
 
     def import_transactions(self):
@@ -1671,11 +1531,33 @@ class TreasureGoblinApp (QMainWindow):
         
         merge_mode = (choice_msg.clickedButton() == merge_button)
         
-        # Call the import function with the selected mode
-        success, message = self.import_export.import_database(merge=merge_mode)
-        
-        # Show result message
+        import_file = self.import_export.choose_import_file(merge=merge_mode)
+        if not import_file:
+            return
+
+        if merge_mode:
+            # Merging reads and writes through its own connections, so it runs on a worker thread
+            worker = ImportWorker(self.import_export, import_file)
+            worker.signals.finished.connect(self.on_import_finished)
+            # Keep the worker referenced until it has run
+            self.import_worker = worker
+            self.db_thread_pool.start(worker)
+        else:
+            # Replacing swaps the database file under this thread's connection, so it stays on the GUI thread.
+            # Workers still reading must finish first so their pooled connections are idle and get closed too.
+            self.db_thread_pool.waitForDone()
+            self.on_import_finished(*self.import_export.import_database(import_file, merge=False))
+
+    def on_import_finished(self, success, message):
+        """Show the result of an import and refresh everything that reads the imported data."""
         if success:
+            # Categories may have been added or the database replaced entirely
+            self.treasure_goblin.invalidate_category_cache()
+            if hasattr(self, 'categories_stack'):
+                self.reload_category_pages()
+            if hasattr(self, 'report_cache'):
+                self.report_cache.clear()
+
             QMessageBox.information(self, "Import Complete", message)
             
             # Refresh the month selector to include any new months from import
@@ -1693,10 +1575,19 @@ class TreasureGoblinApp (QMainWindow):
         if not hasattr(self, 'import_export'):
             self.import_export = TreasureGoblinImportExport(self.treasure_goblin)
         
-        # Call the export function
-        success, message = self.import_export.export_database()
-        
-        # Show result message
+        export_file = self.import_export.choose_export_file()
+        if not export_file:
+            return
+
+        # Write the archive on a worker thread; the result message is shown when it finishes
+        worker = ExportWorker(self.import_export, export_file)
+        worker.signals.finished.connect(self.on_export_finished)
+        # Keep the worker referenced until it has run
+        self.export_worker = worker
+        self.db_thread_pool.start(worker)
+
+    def on_export_finished(self, success, message):
+        """Show the result of an export run by ExportWorker."""
         if success:
             QMessageBox.information(self, "Export Complete", message)
         else:
@@ -1937,8 +1828,6 @@ class TreasureGoblinApp (QMainWindow):
         # Categories title
         title_label = QLabel("Transaction Categories:")
         title_label.setFont(QFont("Arial", 12, QFont.Bold))
-        title_label = QLabel("Transaction Categories:")
-        title_label.setFont(QFont("Arial", 12, QFont.Bold))
         layout.addWidget(title_label)
 
         # Main content area
@@ -1965,10 +1854,11 @@ class TreasureGoblinApp (QMainWindow):
         type_selector_layout.addWidget(self.income_button)
         content_layout.addLayout(type_selector_layout)
 
-        # Categories grid
-        self.categories_grid = QGridLayout()
-        self.categories_grid.setSpacing(10)
-        content_layout.addLayout(self.categories_grid)
+        # Categories grid, one page per category type. Pages are built the first time their type is shown
+        # and kept, so switching between Expenses and Income doesn't rebuild every button
+        self.categories_stack = QStackedWidget()
+        self.category_pages = {}
+        content_layout.addWidget(self.categories_stack)
 
         # Add button for new categories
         add_button = QPushButton("+")
@@ -2041,15 +1931,35 @@ class TreasureGoblinApp (QMainWindow):
                 }}
             """)
 
+        page = self.category_pages.get(self.current_category_type)
+        if page is None:
+            self.load_categories()
+        else:
+            self.categories_stack.setCurrentWidget(page)
+
+    def reload_category_pages(self):
+        """Drop the built pages of both category types and rebuild the one being shown."""
+        for page in self.category_pages.values():
+            self.categories_stack.removeWidget(page)
+            page.deleteLater()
+        self.category_pages.clear()
         self.load_categories()
 
     def load_categories(self):
-        """Load categories of the current type from the database."""
-        # Clear existing categories
-        while self.categories_grid.count():
-            item = self.categories_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Load categories of the current type from the database, replacing its page in the grid."""
+        # Replace the existing page for this type
+        old_page = self.category_pages.pop(self.current_category_type, None)
+        if old_page is not None:
+            self.categories_stack.removeWidget(old_page)
+            old_page.deleteLater()
+
+        page = QWidget()
+        categories_grid = QGridLayout(page)
+        categories_grid.setContentsMargins(0, 0, 0, 0)
+        categories_grid.setSpacing(10)
+        self.category_pages[self.current_category_type] = page
+        self.categories_stack.addWidget(page)
+        self.categories_stack.setCurrentWidget(page)
 
         try:
             # Get categories from database (exclude system categories)
@@ -2061,52 +1971,26 @@ class TreasureGoblinApp (QMainWindow):
                     (self.current_category_type,)
             )
 
-            categories = cursor.fetchall()
-            conn.close()
-
             # Add categories to grid
             row, col = 0,0
             max_cols = 4 # Number of columns in the grid
 
-            for category_id, category_name in categories:
+            # Build each button straight from the cursor rather than collecting the rows first
+            for category_id, category_name in cursor:
                 category_button = QPushButton(category_name)
                 category_button.setMinimumSize(120, 80)
 
-                # Set different colors based on category type
-                if self.current_category_type == 'expense':
-                    category_button.setStyleSheet("""
-                        QPushButton {
-                            background-color: #CC0000;
-                            color: white;
-                            font-size: 16px;
-                            font-weight: bold;
-                            border-radius: 8px;
-                        }
-                        QPushButton:hover {
-                            background-color: #FF0000;
-                        }
-                    """)
-                else:
-                    category_button.setStyleSheet("""
-                        QPushButton {
-                            background-color: #008800;
-                            color: white;
-                            font-size: 16px;
-                            font-weight: bold;
-                            border-radius: 8px;
-                        }
-                        QPushButton:hover {
-                            background-color: #00AA00;
-                        }
-                    """)
+                # Colors come from the theme stylesheet, which Qt parses once for every button
+                category_button.setObjectName(
+                    "expenseCategoryButton" if self.current_category_type == 'expense' else "incomeCategoryButton"
+                )
 
                 # Set up context menu for edit/delete
                 category_button.setContextMenuPolicy(Qt.CustomContextMenu)
-                category_button.customContextMenuRequested.connect(
-                    lambda pos, cid=category_id, cname=category_name: self.show_category_context_menu(pos, cid, cname)
-                )
+                category_button.setProperty("category_id", category_id)
+                category_button.customContextMenuRequested.connect(self.show_category_context_menu)
 
-                self.categories_grid.addWidget(category_button, row, col)
+                categories_grid.addWidget(category_button, row, col)
 
                 # Update grid positive
                 col += 1
@@ -2118,33 +2002,26 @@ class TreasureGoblinApp (QMainWindow):
             add_button = QPushButton("+")
             add_button.setFont(QFont("Arial", 20))
             add_button.setMinimumSize(120, 80)
-            add_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #CD5C5C;
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #DC2F02;
-                }
-            """)
+            add_button.setObjectName("addCategoryButton")
             add_button.clicked.connect(self.add_new_category)
 
-            self.categories_grid.addWidget(add_button, row if col == 0 else row, col)
+            categories_grid.addWidget(add_button, row if col == 0 else row, col)
 
         except Exception as e:
             print(f"Error loading categories: {e}")
 
-    def show_category_context_menu(self, pos, category_id, category_name):
-        """Show context menu for a category button."""
+    def show_category_context_menu(self, pos):
+        """Show context menu for the category button that requested it."""
+        button = self.sender()
+        category_id = button.property("category_id")
+        category_name = button.text()
+
         menu = QMenu()
         edit_action = menu.addAction("Edit")
         delete_action = menu.addAction("Delete")
 
         # Get global position for the menu
-        global_pos = self.sender().mapToGlobal(pos)
+        global_pos = button.mapToGlobal(pos)
         action = menu.exec_(global_pos)
 
         if action == edit_action:
@@ -2262,24 +2139,21 @@ class TreasureGoblinApp (QMainWindow):
                     conn = self.get_db_connection()
                     cursor = conn.cursor()
                 
-                    # Check if category already exists
-                    cursor.execute(
-                        "SELECT id FROM categories WHERE name = ? AND type = ?",
-                        (category_name, self.current_category_type)
-                    )
-                
-                    if cursor.fetchone():
+                    # Add new category. The UNIQUE (name, type) constraint rejects duplicates, so there's no
+                    # separate existence check to race against
+                    try:
+                        with self.treasure_goblin.write_transaction():
+                            cursor.execute(
+                                "INSERT INTO categories (name, type) VALUES (?, ?)",
+                                (category_name, self.current_category_type)
+                            )
+                    except sqlite3.IntegrityError:
                         QMessageBox.warning(
                             self, "Duplicate Category", 
                             f"A {self.current_category_type} category named '{category_name}' already exists."
                         )
                     else:
-                        # Add new category
-                        cursor.execute(
-                            "INSERT INTO categories (name, type) VALUES (?, ?)",
-                            (category_name, self.current_category_type)
-                        )
-                        conn.commit()
+                        self.treasure_goblin.invalidate_category_cache()
                         # Create styled success message
                         success_msg = QMessageBox(self)
                         success_msg.setIcon(QMessageBox.Information)
@@ -2316,7 +2190,6 @@ class TreasureGoblinApp (QMainWindow):
                         # Reload categories
                         self.load_categories()
                 
-                    conn.close()
                 
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to add category: {str(e)}")
@@ -2435,13 +2308,14 @@ class TreasureGoblinApp (QMainWindow):
                     conn = self.get_db_connection()
                     cursor = conn.cursor()
 
-                    # Check if the new name already exists
-                    cursor.execute(
-                        "SELECT id FROM categories WHERE name =? AND type = ? AND id != ?",
-                            (new_name, self.current_category_type, category_id)
-                    )
-
-                    if cursor.fetchone():
+                    # Update category name. The UNIQUE (name, type) constraint rejects a name already in use
+                    try:
+                        with self.treasure_goblin.write_transaction():
+                            cursor.execute(
+                                "UPDATE categories SET name = ? WHERE id = ?",
+                                    (new_name, category_id)
+                            )
+                    except sqlite3.IntegrityError:
                         # Create styled warning message
                         warning_msg = QMessageBox(self)
                         warning_msg.setIcon(QMessageBox.Warning)
@@ -2476,12 +2350,8 @@ class TreasureGoblinApp (QMainWindow):
                         """)
                         warning_msg.exec_()
                     else:
-                        # Update category name
-                        cursor.execute(
-                            "UPDATE categories SET name = ? WHERE id = ?",
-                                (new_name, category_id)
-                        )
-                        conn.commit()
+                        # The old name must no longer resolve to this category
+                        self.treasure_goblin.invalidate_category_cache()
                         
                         # Create styled success message
                         success_msg = QMessageBox(self)
@@ -2520,7 +2390,6 @@ class TreasureGoblinApp (QMainWindow):
                         # Reload categories
                         self.load_categories()
 
-                    conn.close()
 
                 except Exception as e:
                     # Create styled error message
@@ -2603,7 +2472,6 @@ class TreasureGoblinApp (QMainWindow):
                     }}
                 """)
                 warning_msg.exec_()
-                conn.close()
                 return
 
             # Get the category type to determine which {NO_CATEGORY} to use
@@ -2646,7 +2514,6 @@ class TreasureGoblinApp (QMainWindow):
                     }}
                 """)
                 warning_msg.exec_()
-                conn.close()
                 return
             
             category_type = category_type_result[0]
@@ -2700,7 +2567,6 @@ class TreasureGoblinApp (QMainWindow):
                 confirm_msg.setDefaultButton(QMessageBox.No)
 
                 if confirm_msg.exec_() != QMessageBox.Yes:
-                    conn.close()
                     return
             else:
                 # Create styled confirmation dialog for unused categories
@@ -2739,7 +2605,6 @@ class TreasureGoblinApp (QMainWindow):
                 confirm_msg.setDefaultButton(QMessageBox.No)
 
                 if confirm_msg.exec_() != QMessageBox.Yes:
-                    conn.close()
                     return
 
             # Get the {NO_CATEGORY} ID for this transaction type
@@ -2782,108 +2647,99 @@ class TreasureGoblinApp (QMainWindow):
                     }}
                 """)
                 error_msg.exec_()
-                conn.close()
                 return
             
             no_category_id = no_category_result[0]
 
-            # Begin transaction
-            cursor.execute("BEGIN")
-
-            try:
-                # Reassign all transactions from the deleted category to {NO_CATEGORY}
-                cursor.execute(
+            # Reassign and delete in one transaction; the count moved is taken from the update itself,
+            # so it stays accurate even if transactions changed while the confirmation was open
+            with self.treasure_goblin.write_transaction():
+                moved_count = cursor.execute(
                     "UPDATE transactions SET category_id = ? WHERE category_id = ?",
                     (no_category_id, category_id)
-                )
+                ).rowcount
 
-                # Delete the category
                 cursor.execute("DELETE FROM categories WHERE id = ?", (category_id,))
 
-                # Commit the transaction
-                cursor.execute("COMMIT")
-
-                if usage_count > 0:
-                    # Create styled success message for categories with transactions
-                    success_msg = QMessageBox(self)
-                    success_msg.setIcon(QMessageBox.Information)
-                    success_msg.setWindowTitle("Success")
-                    success_msg.setText(f"Category '{category_name}' deleted successfully!")
-                    success_msg.setInformativeText(
-                        f"{usage_count} transactions have been moved to {{NO_CATEGORY}}. "
-                        "You can find and reassign them in the Transactions tab."
-                    )
-                    success_msg.setStyleSheet(f"""
-                        QMessageBox {{
-                            background-color: {TreasureGoblinTheme.COLORS['surface']};
-                            color: {TreasureGoblinTheme.COLORS['text_primary']};
-                            font-size: 16px;
-                        }}
-                        QMessageBox QLabel {{
-                            color: {TreasureGoblinTheme.COLORS['text_primary']};
-                            font-size: 16px;
-                            font-weight: bold;
-                            margin: 10px;
-                        }}
-                        QMessageBox QPushButton {{
-                            background-color: #CD5C5C;
-                            color: white;
-                            font-size: 14px;
-                            font-weight: bold;
-                            padding: 8px 16px;
-                            margin: 4px;
-                            min-width: 70px;
-                            min-height: 30px;
-                            border-radius: 4px;
-                        }}
-                        QMessageBox QPushButton:hover {{
-                            background-color: #DC2F02;
-                        }}
-                    """)
-                    success_msg.exec_()
-                else:
-                    # Create styled success message for unused categories
-                    success_msg = QMessageBox(self)
-                    success_msg.setIcon(QMessageBox.Information)
-                    success_msg.setWindowTitle("Success")
-                    success_msg.setText(f"Category '{category_name}' deleted successfully!")
-                    success_msg.setStyleSheet(f"""
-                        QMessageBox {{
-                            background-color: {TreasureGoblinTheme.COLORS['surface']};
-                            color: {TreasureGoblinTheme.COLORS['text_primary']};
-                            font-size: 16px;
-                        }}
-                        QMessageBox QLabel {{
-                            color: {TreasureGoblinTheme.COLORS['text_primary']};
-                            font-size: 16px;
-                            font-weight: bold;
-                            margin: 10px;
-                        }}
-                        QMessageBox QPushButton {{
-                            background-color: #CD5C5C;
-                            color: white;
-                            font-size: 14px;
-                            font-weight: bold;
-                            padding: 8px 16px;
-                            margin: 4px;
-                            min-width: 70px;
-                            min-height: 30px;
-                            border-radius: 4px;
-                        }}
-                        QMessageBox QPushButton:hover {{
-                            background-color: #DC2F02;
-                        }}
-                    """)
-                    success_msg.exec_()
-
-                # Reload categories
-                self.load_categories()
+            # Drop the deleted category from the data manager's lookup cache
+            self.treasure_goblin.invalidate_category_cache()
+
+            if moved_count > 0:
+                # Create styled success message for categories with transactions
+                success_msg = QMessageBox(self)
+                success_msg.setIcon(QMessageBox.Information)
+                success_msg.setWindowTitle("Success")
+                success_msg.setText(f"Category '{category_name}' deleted successfully!")
+                success_msg.setInformativeText(
+                    f"{moved_count} transactions have been moved to {{NO_CATEGORY}}. "
+                    "You can find and reassign them in the Transactions tab."
+                )
+                success_msg.setStyleSheet(f"""
+                    QMessageBox {{
+                        background-color: {TreasureGoblinTheme.COLORS['surface']};
+                        color: {TreasureGoblinTheme.COLORS['text_primary']};
+                        font-size: 16px;
+                    }}
+                    QMessageBox QLabel {{
+                        color: {TreasureGoblinTheme.COLORS['text_primary']};
+                        font-size: 16px;
+                        font-weight: bold;
+                        margin: 10px;
+                    }}
+                    QMessageBox QPushButton {{
+                        background-color: #CD5C5C;
+                        color: white;
+                        font-size: 14px;
+                        font-weight: bold;
+                        padding: 8px 16px;
+                        margin: 4px;
+                        min-width: 70px;
+                        min-height: 30px;
+                        border-radius: 4px;
+                    }}
+                    QMessageBox QPushButton:hover {{
+                        background-color: #DC2F02;
+                    }}
+                """)
+                success_msg.exec_()
+            else:
+                # Create styled success message for unused categories
+                success_msg = QMessageBox(self)
+                success_msg.setIcon(QMessageBox.Information)
+                success_msg.setWindowTitle("Success")
+                success_msg.setText(f"Category '{category_name}' deleted successfully!")
+                success_msg.setStyleSheet(f"""
+                    QMessageBox {{
+                        background-color: {TreasureGoblinTheme.COLORS['surface']};
+                        color: {TreasureGoblinTheme.COLORS['text_primary']};
+                        font-size: 16px;
+                    }}
+                    QMessageBox QLabel {{
+                        color: {TreasureGoblinTheme.COLORS['text_primary']};
+                        font-size: 16px;
+                        font-weight: bold;
+                        margin: 10px;
+                    }}
+                    QMessageBox QPushButton {{
+                        background-color: #CD5C5C;
+                        color: white;
+                        font-size: 14px;
+                        font-weight: bold;
+                        padding: 8px 16px;
+                        margin: 4px;
+                        min-width: 70px;
+                        min-height: 30px;
+                        border-radius: 4px;
+                    }}
+                    QMessageBox QPushButton:hover {{
+                        background-color: #DC2F02;
+                    }}
+                """)
+                success_msg.exec_()
 
-            except Exception as e:
-                cursor.execute("ROLLBACK")
-                raise e
+            # Reload categories
+            self.load_categories()
 
-            conn.close()
 
         except Exception as e:
             # Create styled error message
@@ -2920,17 +2776,6 @@ class TreasureGoblinApp (QMainWindow):
             """)
             error_msg.exec_()
 
-    def get_db_connection(self):
-        """Get a connection to the SQLite database."""
-        try:
-            conn = sqlite3.connect(self.treasure_goblin.db_path)
-            conn.row_factory = sqlite3.Row
-            return conn
-        except sqlite3.Error as e:
-            QMessageBox.critical(self, "Database Error", f"Failed to connect to database: {str(e)}")
-            return None
-        
-
     def create_reports_tab(self):
         """Create the reports tab with visualizations of financial data."""
         tab = QWidget()
@@ -3127,9 +2972,26 @@ class TreasureGoblinApp (QMainWindow):
         self.current_report_period = 'monthly'
         self.current_chart_type = 'pie'
 
+        # Category totals by (report type, start date, end date), valid while the data version is unchanged
+        self.report_cache = {}
+        self.report_cache_version = None
+
+        # One chart canvas per chart type, created on first use and redrawn in place, and the chart types
+        # whose canvas currently shows report_chart_data
+        self.report_charts = {}
+        self.report_charts_drawn = set()
+        self.report_chart_data = None
+
         # Intitialize current date for reports (use current date)
         self.current_report_date = QDate.currentDate()
 
+        # Regenerates the report once the period selection settles, so stepping through periods with the
+        # keyboard or mouse wheel draws one chart instead of one per step
+        self.report_timer = QTimer(self)
+        self.report_timer.setSingleShot(True)
+        self.report_timer.setInterval(150)
+        self.report_timer.timeout.connect(self.generate_report)
+
         # Populate period dropdown and connect signal
         self.populate_report_period_selector()
         self.report_period_combo.currentIndexChanged.connect(self.on_report_period_changed)
@@ -3146,53 +3008,22 @@ class TreasureGoblinApp (QMainWindow):
         self.report_period_combo.clear()
 
         try:
-            conn = self.get_db_connection()
-            cursor = conn.cursor()
-
             if self.current_report_period == 'monthly':
-                # Get all unique year-month combinations from transactions
-                query = """
-                    SELECT DISTINCT
-                        strftime('%Y', date) as year,
-                        strftime('%m', date) as month,
-                        strftime('%Y-%m', date) as year_month
-                    FROM transactions
-                    ORDER BY year_month DESC
-                """
-
-                cursor.execute(query)
-                results = cursor.fetchall()
-
-                # Add each month-year combination to the dropdown
-                for year, month, year_month in results:
+                # Add each month that has transactions to the dropdown
+                for year, month in self.treasure_goblin.get_transaction_months():
                     # Convert to readable format
-                    date_obj = datetime.strptime(f"{year}-{month}-01", "%Y-%m-%d")
-                    display_text = date_obj.strftime("%B %Y")
+                    display_text = datetime(year, month, 1).strftime("%B %Y")
 
                     # Store as QDate for easy comparison
-                    qdate = QDate(int(year), int(month), 1)
+                    qdate = QDate(year, month, 1)
                     self.report_period_combo.addItem(display_text, qdate)
 
             else: # yearly
-                # Get all unique years from transactions
-                query = """
-                    SELECT DISTINCT strftime('%Y', date) as year
-                    FROM transactions
-                    ORDER BY year DESC
-                """
-
-                cursor.execute(query)
-                results = cursor.fetchall()
-
-                # Add each year to the dropdown
-                for (year,) in results:
-                    display_text = year
-
+                # Add each year that has transactions to the dropdown
+                for year in self.treasure_goblin.get_transaction_years():
                     # Store as QDate (January 1st of that year)
-                    qdate = QDate(int(year), 1, 1)
-                    self.report_period_combo.addItem(display_text, qdate)
-
-            conn.close()
+                    qdate = QDate(year, 1, 1)
+                    self.report_period_combo.addItem(str(year), qdate)
 
             # If no transactions exist, add current period as default
             if self.report_period_combo.count() == 0:
@@ -3253,7 +3084,7 @@ class TreasureGoblinApp (QMainWindow):
             selected_date = self.report_period_combo.itemData(current_index)
             if selected_date:
                 self.current_report_date = selected_date
-                self.generate_report()
+                self.report_timer.start()
 
     def switch_report_type(self, report_type):
         """Switch between expense and income reports."""
@@ -3310,8 +3141,15 @@ class TreasureGoblinApp (QMainWindow):
                 self.display_no_data_message()
                 return
 
-            # Display chart based on chart type
-            if self.current_chart_type == 'pie':
+            # Drawn charts stay valid until the report data changes
+            if data is not self.report_chart_data:
+                self.report_charts_drawn.clear()
+                self.report_chart_data = data
+
+            # Display chart based on chart type, reusing the canvas if it was already drawn
+            if self.current_chart_type in self.report_charts_drawn:
+                self.show_report_chart(self.current_chart_type)
+            elif self.current_chart_type == 'pie':
                 self.display_pie_chart(data)
             else:
                 self.display_bar_chart(data)
@@ -3322,53 +3160,31 @@ class TreasureGoblinApp (QMainWindow):
 
     def get_report_date_range(self):
         """Calculate the date range for the current report settings."""
-        if self.current_report_period == 'monthly':
-            # Start of month
-            start_date = QDate(self.current_report_date.year(),
-                               self.current_report_date.month(), 1)
-            
-            # End of month - calculate last day
-            if self.current_report_date.month() == 12:
-                end_date = QDate(self.current_report_date.year(), 12, 31)
-            else:
-                next_month = QDate(self.current_report_date.year(),
-                                   self.current_report_date.month() + 1, 1)
-                end_date = next_month.addDays(-1)
-        else:
-            # Start of year
-            start_date = QDate(self.current_report_date.year(), 1, 1)
+        year = self.current_report_date.year()
 
-            # End of year
-            end_date = QDate(self.current_report_date.year(), 12, 31)
-
-        # Convert to strings for SQL query
-        start_date_str = start_date.toString("yyyy-MM-dd")
-        end_date_str = end_date.toString("yyyy-MM-dd")
+        if self.current_report_period == 'monthly':
+            # First to last day of the month
+            month = self.current_report_date.month()
+            last_day = calendar.monthrange(year, month)[1]
+            return f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}"
 
-        return start_date_str, end_date_str
+        # First to last day of the year
+        return f"{year}-01-01", f"{year}-12-31"
     
     def get_report_data(self, start_date, end_date):
-        """Get data for the current report from the database."""
-        conn = self.get_db_connection()
-        cursor = conn.cursor()
-
-        query = """
-            SELECT
-                c.name as category,
-                SUM(t.amount) as total
-            FROM transactions t
-            JOIN categories c ON t.category_id = c.id
-            WHERE t.type = ? AND t.date BETWEEN ? AND ? AND c.name != '{NO_CATEGORY}'
-            GROUP BY c.name
-            ORDER BY total DESC
-        """
-
-        cursor.execute(query, (self.current_report_type, start_date, end_date))
-        data = cursor.fetchall()
-
-        conn.close()
-
-        return data
+        """Get data for the current report from the database, reusing it until the data changes."""
+        version = self.treasure_goblin.data_version()
+        if version != self.report_cache_version:
+            self.report_cache.clear()
+            self.report_cache_version = version
+
+        key = (self.current_report_type, start_date, end_date)
+        if key not in self.report_cache:
+            # Report periods are whole months or years, so the per-month category totals cover them exactly
+            self.report_cache[key] = self.treasure_goblin.get_category_totals(
+                self.current_report_type, start_date[:7], end_date[:7]
+            )
+        return self.report_cache[key]
     
     def display_no_data_message(self):
         """Display a message when no data is available."""
@@ -3385,12 +3201,35 @@ class TreasureGoblinApp (QMainWindow):
         self.chart_area.layout().addWidget(message)
 
     def clear_chart_area(self):
-        """Clear all widgets from the chart area layout."""
+        """Clear all widgets from the chart area layout, hiding drawn charts that may be shown again."""
         if self.chart_layout is not None:
             while self.chart_layout.count():
-                item = self.chart_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+                widget = self.chart_layout.takeAt(0).widget()
+                if widget is None:
+                    continue
+                if widget in self.report_charts.values():
+                    widget.hide()
+                else:
+                    widget.deleteLater()
+
+    def get_report_figure(self, chart_type, figsize):
+        """Return the cleared figure of the canvas kept for a chart type, creating the canvas on first use."""
+        canvas = self.report_charts.get(chart_type)
+        if canvas is None:
+            # matplotlib is slow to import, so it's loaded with the first chart instead of at startup
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.figure import Figure
+
+            canvas = self.report_charts[chart_type] = FigureCanvas(Figure(figsize=figsize, dpi=100))
+        canvas.figure.clear()
+        return canvas.figure
+
+    def show_report_chart(self, chart_type):
+        """Put the kept canvas for a chart type in the chart area."""
+        canvas = self.report_charts[chart_type]
+        self.clear_chart_area()
+        self.chart_layout.addWidget(canvas)
+        canvas.show()
 
     def display_error_message(self, error_message):
         """Display an errror message in the chart area."""
@@ -3417,8 +3256,7 @@ class TreasureGoblinApp (QMainWindow):
         amounts = [item[1] for item in data]
 
         # Create a figure and a set of subplots
-        figure = Figure(figsize=(6, 6), dpi=100)
-        canvas = FigureCanvas(figure)
+        figure = self.get_report_figure('pie', (6, 6))
         ax = figure.add_subplot(111)
 
         # Create the pie chart
@@ -3445,7 +3283,9 @@ class TreasureGoblinApp (QMainWindow):
         figure.patch.set_facecolor('#E0E0E0')
 
         # Add the pie chart to the chart area
-        self.chart_layout.addWidget(canvas)
+        figure.canvas.draw_idle()
+        self.report_charts_drawn.add('pie')
+        self.show_report_chart('pie')
 
     def display_bar_chart(self, data):
         """Display a bar chart visualization"""
@@ -3467,18 +3307,14 @@ class TreasureGoblinApp (QMainWindow):
         estimated_left_margin = min (0.3, max(0.15, max_label_length * 0.012))
 
         # Create a figure and a set of subplots
-        figure = Figure(figsize=(10, 6), dpi=100)
-        canvas = FigureCanvas(figure)
+        figure = self.get_report_figure('bar', (10, 6))
         ax = figure.add_subplot(111)
 
         # Create a horizontal bar chart
         bars = ax.barh(categories, amounts, color='#CD5C5C')
 
         # Add data labels to the right of each bar
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width + max(amounts) * 0.01, bar.get_y() + bar.get_height()/2,
-                    f'${width:.2f}', ha='left', va='center', fontweight='bold')
+        ax.bar_label(bars, labels=[f'${amount:.2f}' for amount in amounts], padding=3, fontweight='bold')
             
         # Remove the top and right spines
         ax.spines['top'].set_visible(False)
@@ -3507,11 +3343,26 @@ class TreasureGoblinApp (QMainWindow):
         )
 
         # Add the bar chart to the chart area
-        self.chart_layout.addWidget(canvas)
+        figure.canvas.draw_idle()
+        self.report_charts_drawn.add('bar')
+        self.show_report_chart('bar')
+
+
+def report_unhandled_exception(exc_type, exc_value, exc_traceback):
+    """
+    Log an exception that escaped a Qt slot and tell the user, instead of letting PyQt abort the application.
+
+    Installed as sys.excepthook by main(), so handlers only need to catch the errors they can act on.
+    """
+    traceback.print_exception(exc_type, exc_value, exc_traceback)
+    if QApplication.instance() is not None:
+        QMessageBox.critical(None, "Error", f"An unexpected error occurred: {str(exc_value)}")
 
 
 def main():
     """Main entry point for the application."""
+    sys.excepthook = report_unhandled_exception
+
     app = QApplication(sys.argv)
 
     app.setStyle("Fusion")
@@ -3524,7 +3375,12 @@ def main():
     main_window.show()
 
     # Run the application event loop
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+
+    # Close the database connection so the write-ahead log is checkpointed
+    treasure_goblin.close_db_connection()
+
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -16,11 +16,6 @@ from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
                              QLabel, QPushButton, QCheckBox, QComboBox,
                              QFormLayout, QProgressBar, QMessageBox, QApplication)
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
 
 
 class GoogleDriveSync(QObject):
@@ -79,6 +74,11 @@ class GoogleDriveSync(QObject):
 
     def get_credentials(self):
         """Get and refresh Google Drive API credentials."""
+        # The Google client libraries are slow to import, so they're only loaded once sync is actually used
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+
         creds = None
 
         # Load token from config if available
@@ -147,6 +147,8 @@ class GoogleDriveSync(QObject):
 
     def get_drive_service(self):
         """Create and return a Google Drive API service instance."""
+        from googleapiclient.discovery import build
+
         creds = self.get_credentials()
         if not creds:
             return None
@@ -201,7 +203,8 @@ class GoogleDriveSync(QObject):
             with tempfile.TemporaryDirectory() as temp_assembly_dir:
                 temp_path = Path(temp_assembly_dir)
 
-                # Copy database file
+                # Copy database file (after flushing the write-ahead log into it)
+                self.treasure_goblin.checkpoint_database()
                 db_dest = temp_path / "treasuregoblin.db"
                 shutil.copy2(db_path, db_dest)
 
@@ -254,6 +257,7 @@ class GoogleDriveSync(QObject):
             self.sync_progress.emit(0)
 
             # Prepare the media upload
+            from googleapiclient.http import MediaFileUpload
             media = MediaFileUpload(
                 backup_file_path,
                 mimetype='application/zip',
@@ -333,8 +337,6 @@ class GoogleDriveSync(QObject):
             cursor.execute("SELECT COUNT(*) FROM transactions WHERE type = 'expense'")
             expense = cursor.fetchone()[0]
 
-            conn.close()
-
             return {
                 "total": total,
                 "income": income,
@@ -167,6 +167,43 @@ class TreasureGoblinTheme:
             background-color: {c['danger_light']};
         }}
 
+        /* Category Buttons */
+        QPushButton#expenseCategoryButton {{
+            background-color: #CC0000;
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            border-radius: 8px;
+        }}
+
+        QPushButton#expenseCategoryButton:hover {{
+            background-color: #FF0000;
+        }}
+
+        QPushButton#incomeCategoryButton {{
+            background-color: #008800;
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            border-radius: 8px;
+        }}
+
+        QPushButton#incomeCategoryButton:hover {{
+            background-color: #00AA00;
+        }}
+
+        QPushButton#addCategoryButton {{
+            background-color: #CD5C5C;
+            color: white;
+            font-size: 24px;
+            font-weight: bold;
+            border-radius: 8px;
+        }}
+
+        QPushButton#addCategoryButton:hover {{
+            background-color: #DC2F02;
+        }}
+
         /* List Widgets */
         QListWidget {{
             background-color: {c['surface']};
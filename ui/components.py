@@ -4,9 +4,11 @@ TreasureGoblin UI Components
 Reusable UI components and widgets for the TreasureGoblin application.
 """
 
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize
 from PyQt5.QtWidgets import (QFrame, QPushButton, QWidget, QVBoxLayout,
-                             QHBoxLayout, QLabel, QGraphicsDropShadowEffect)
-from PyQt5.QtGui import QColor
+                             QHBoxLayout, QLabel, QGraphicsDropShadowEffect,
+                             QStyledItemDelegate, QStyle)
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter
 
 from theme import TreasureGoblinTheme
 
@@ -134,51 +136,164 @@ class CategoryButton(QPushButton):
         """)
 
 
-class TransactionItemWidget(QWidget):
-    """Custom widget for transaction list items with hover effects"""
+class TransactionListModel(QAbstractListModel):
+    """List model holding transaction rows for display in a QListView"""
+
+    # Role returning the whole transaction row (id, date, amount, type, category, tag)
+    TransactionRole = Qt.UserRole + 1
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.is_selected = False
-        self.is_hovered = False
-        self.default_style = ""
-
-    def set_default_style(self, style):
-        """Set the default style for no-category"""
-        self.default_style = style
-        self.update_style()
-
-    def update_style(self):
-        """Update the widget style based on state"""
-        if self.is_selected:
-            self.setStyleSheet(f"""
-                {self.default_style}
-                background-color: {TreasureGoblinTheme.COLORS['primary_dark']};
-                border: 1px solid {TreasureGoblinTheme.COLORS['accent']};
-                border-radius: 4px;
-            """)
-        elif self.is_hovered:
-            self.setStyleSheet(f"""
-                {self.default_style}
-                background-color: rgba(45, 106, 79, 0.3);
-                border-radius: 4px;
-            """)
-        else:
-            self.setStyleSheet(self.default_style)
-
-    def enterEvent(self, event):
-        """Mouse enters the widget"""
-        self.is_hovered = True
-        self.update_style()
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        """Mouse leaves the widget"""
-        self.is_hovered = False
-        self.update_style()
-        super().leaveEvent(event)
-
-    def set_selected(self, selected):
-        """Set selection state"""
-        self.is_selected = selected
-        self.update_style()
+        self.transactions = []
+
+    def set_transactions(self, transactions):
+        """Replace all rows in one model reset"""
+        self.beginResetModel()
+        self.transactions = list(transactions)
+        self.endResetModel()
+
+    def insert_transaction(self, transaction, limit=None):
+        """
+        Insert one row in newest-first date order without resetting the model.
+
+        With a limit, the list is kept to that many rows by dropping the oldest. Returns False if the transaction
+        is older than every row it would have to displace.
+        """
+        position = len(self.transactions)
+        for row, existing in enumerate(self.transactions):
+            if existing['date'] <= transaction['date']:
+                position = row
+                break
+
+        if limit is not None and position >= limit:
+            return False
+
+        self.beginInsertRows(QModelIndex(), position, position)
+        self.transactions.insert(position, transaction)
+        self.endInsertRows()
+
+        if limit is not None and len(self.transactions) > limit:
+            self.beginRemoveRows(QModelIndex(), limit, len(self.transactions) - 1)
+            del self.transactions[limit:]
+            self.endRemoveRows()
+
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.transactions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        transaction = self.transactions[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{format_transaction_date(transaction['date'])}  {describe_transaction(transaction)}  " \
+                   f"${transaction['amount']:.2f}"
+        if role == Qt.UserRole:
+            return transaction['id']
+        if role == self.TransactionRole:
+            return transaction
+        if role == Qt.ToolTipRole and transaction['category'] == '{NO_CATEGORY}':
+            return "This transaction needs a category assignment"
+        return None
+
+
+class TransactionItemDelegate(QStyledItemDelegate):
+    """Paints transaction rows as date, description and amount columns, without a widget per row"""
+
+    def __init__(self, font_size=14, amount_font_size=16, row_height=40, highlight_no_category=False, parent=None):
+        super().__init__(parent)
+        c = TreasureGoblinTheme.COLORS
+        self.row_height = row_height
+        self.highlight_no_category = highlight_no_category
+
+        # Fonts and colors are built once and shared by every row
+        self.text_font = QFont()
+        self.text_font.setPixelSize(font_size)
+        self.text_font.setBold(True)
+        self.amount_font = QFont("Consolas")
+        self.amount_font.setPixelSize(amount_font_size)
+        self.amount_font.setBold(True)
+
+        # Column widths fit the widest date and a typical amount in these fonts
+        self.date_width = QFontMetrics(self.text_font).horizontalAdvance("00/00/00")
+        self.amount_width = QFontMetrics(self.amount_font).horizontalAdvance("$0000.00")
+
+        self.date_color = QColor(c['text_secondary'])
+        self.description_color = QColor(c['text_primary'])
+        self.amount_colors = {'income': QColor(c['success_light']), 'expense': QColor(c['danger_light'])}
+        self.selected_color = QColor(c['primary_dark'])
+        self.accent_color = QColor(c['accent'])
+        self.no_category_color = QColor(c['surface'])
+        self.hover_color = QColor(45, 106, 79, 77)
+
+    def paint(self, painter, option, index):
+        transaction = index.data(TransactionListModel.TransactionRole)
+        no_category = self.highlight_no_category and transaction['category'] == '{NO_CATEGORY}'
+        rect = option.rect.adjusted(0, 3, 0, -3)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Row background, matching the old per-row widget styles
+        if option.state & QStyle.State_Selected:
+            painter.setPen(self.accent_color)
+            painter.setBrush(self.selected_color)
+            painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 4, 4)
+        elif option.state & QStyle.State_MouseOver:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.hover_color)
+            painter.drawRoundedRect(rect, 4, 4)
+        elif no_category:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.no_category_color)
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.fillRect(rect.x(), rect.y(), 3, rect.height(), self.accent_color)
+
+        content = rect.adjusted(12, 0, -12, 0)
+        align = Qt.AlignVCenter
+
+        # Warning marker for transactions that need a category
+        painter.setFont(self.text_font)
+        if no_category:
+            painter.setPen(self.description_color)
+            painter.drawText(content, Qt.AlignLeft | align, "⚠️")
+            content.setLeft(content.left() + painter.fontMetrics().horizontalAdvance("⚠️") + 6)
+
+        # Date
+        painter.setPen(self.date_color)
+        painter.drawText(content.x(), content.y(), self.date_width, content.height(), Qt.AlignLeft | align,
+                         format_transaction_date(transaction['date']))
+
+        # Amount, right aligned and colored by type
+        painter.setFont(self.amount_font)
+        painter.setPen(self.amount_colors.get(transaction['type'], self.description_color))
+        painter.drawText(content, Qt.AlignRight | align, f"${transaction['amount']:.2f}")
+
+        # Category and tag in the space left between the date and amount
+        painter.setFont(self.text_font)
+        painter.setPen(self.description_color)
+        description_rect = content.adjusted(self.date_width + 10, 0, -(self.amount_width + 10), 0)
+        description = painter.fontMetrics().elidedText(
+            describe_transaction(transaction), Qt.ElideRight, description_rect.width()
+        )
+        painter.drawText(description_rect, Qt.AlignLeft | align, description)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.row_height)
+
+
+def format_transaction_date(iso_date):
+    """Format a stored 'YYYY-MM-DD' date for display in transaction lists"""
+    # Dates are always stored as date.isoformat(), so reorder the pieces directly
+    return f"{iso_date[5:7]}/{iso_date[8:10]}/{iso_date[2:4]}"
+
+
+def describe_transaction(transaction):
+    """Category name, followed by the tag in parentheses if there is one"""
+    if transaction['tag']:
+        return f"{transaction['category']} ({transaction['tag']})"
+    return transaction['category']
@@ -4,6 +4,7 @@ TreasureGoblin Import/Export Utilities
 Handles database import and export operations for TreasureGoblin.
 """
 
+from contextlib import closing
 from datetime import datetime
 import json
 import shutil
@@ -14,6 +15,8 @@ from pathlib import Path
 
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 
+from core.models import insert_transactions, to_cents
+
 
 class TreasureGoblinImportExport:
     """Helper class for handling import/export operations in TreasureGoblin."""
@@ -27,55 +30,58 @@ class TreasureGoblinImportExport:
         """
         self.treasure_goblin = treasure_goblin
 
-    def export_database(self):
+    def choose_export_file(self):
         """
-        Export the entire database to a zip archive.
+        Ask the user where to save the export. Must be called on the GUI thread.
 
         Returns:
-            Tuple (success: bool, message: str) indicating operation result
+            str: Path of the zip archive to write, or None if the user cancelled
         """
-        try:
-            # Ask user for export location
-            export_file, _ = QFileDialog.getSaveFileName(
-                None,
-                "Export Financial Data",
-                str(Path.home() / "TreasureGoblin_Export.zip"),
-                "Zip Files (*.zip)"
-            )
-
-            if not export_file:
-                return False, "Export cancelled"
+        export_file, _ = QFileDialog.getSaveFileName(
+            None,
+            "Export Financial Data",
+            str(Path.home() / "TreasureGoblin_Export.zip"),
+            "Zip Files (*.zip)"
+        )
+        return export_file or None
+
+    def export_database(self, export_file):
+        """
+        Export the entire database to a zip archive.
 
-            # Get database path
-            db_path = self.treasure_goblin.db_path
+        Only reads through a pooled read-only connection and shows no dialogs, so it can run on a worker thread.
 
-            # Create a timestamp for the backup file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"treasuregoblin_backup_{timestamp}.zip"
+        Args:
+            export_file: Path of the zip archive to write
 
+        Returns:
+            Tuple (success: bool, message: str) indicating operation result
+        """
+        try:
             # Create a temporary directory for the export
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
 
-                # Copy database file
+                # Copy the database with SQLite's backup API. It reads one consistent snapshot, including
+                # anything still in the write-ahead log, while the app keeps writing.
                 db_dest = temp_path / "treasuregoblin.db"
-                shutil.copy2(db_path, db_dest)
+                with self.treasure_goblin.read_connection() as conn:
+                    with closing(sqlite3.connect(db_dest)) as dest_conn:
+                        conn.backup(dest_conn)
 
-                # Create metadata file
+                # Create metadata
                 metadata = {
                     "export_date": datetime.now().isoformat(),
                     "app_version": "1.0",
                     "transaction_count": self._get_transaction_count()
                 }
 
-                with open(temp_path / "metadata.json", "w") as f:
-                    json.dump(metadata, f, indent=2)
-
-                # Create the zip file
-                with zipfile.ZipFile(export_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # Create the zip file. ZipFile.write compresses the database in chunks straight from disk,
+                # so memory use doesn't grow with the size of the database.
+                with zipfile.ZipFile(export_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
                     # Add database and metadata files
                     zipf.write(db_dest, "treasuregoblin.db")
-                    zipf.write(temp_path / "metadata.json", "metadata.json")
+                    zipf.writestr("metadata.json", json.dumps(metadata, indent=2))
 
             # Store the path for later reference
             self.last_export_path = export_file
@@ -93,36 +99,73 @@ class TreasureGoblinImportExport:
             Dict containing transaction counts by type and total
         """
         try:
-            conn = self.treasure_goblin.get_db_connection()
-            cursor = conn.cursor()
-
-            # Get total count
-            cursor.execute("SELECT COUNT(*) FROM transactions")
-            total = cursor.fetchone()[0]
-
-            # Get income count
-            cursor.execute("SELECT COUNT(*) FROM transactions WHERE type = 'income'")
-            income = cursor.fetchone()[0]
-
-            # Get expense count
-            cursor.execute("SELECT COUNT(*) FROM transactions WHERE type = 'expense'")
-            expense = cursor.fetchone()[0]
-
-            conn.close()
-
+            with self.treasure_goblin.read_connection() as conn:
+                # The monthly totals already hold per-type counts, so the transactions table isn't scanned
+                counts = dict(conn.execute(
+                    "SELECT type, SUM(count) FROM transaction_monthly_totals GROUP BY type"
+                ).fetchall())
+
+            income = counts.get('income', 0)
+            expense = counts.get('expense', 0)
             return {
-                "total": total,
+                "total": income + expense,
                 "income": income,
                 "expense": expense
             }
         except:
             return {"total": 0, "income": 0, "expense": 0}
 
-    def import_database(self, merge=True):
+    def choose_import_file(self, merge=True):
+        """
+        Ask the user for the archive to import and confirm the import. Must be called on the GUI thread.
+
+        Args:
+            merge: If True, the confirmation describes merging; otherwise it warns that data will be replaced
+
+        Returns:
+            str: Path of the zip archive to import, or None if the user cancelled
+        """
+        # Ask user for import file
+        import_file, _ = QFileDialog.getOpenFileName(
+            None,
+            "Import Financial Data",
+            str(Path.home()),
+            "Zip Files (*.zip)"
+        )
+
+        if not import_file:
+            return None
+
+        # Confirm import
+        confirm_msg = QMessageBox()
+        confirm_msg.setIcon(QMessageBox.Warning)
+        confirm_msg.setWindowTitle("Confirm Import")
+
+        if merge:
+            confirm_msg.setText("Merge imported transactions with your current data?")
+            confirm_msg.setInformativeText(
+                "This will add the imported transactions to your existing financial history.")
+        else:
+            confirm_msg.setText("Importing will replace your current financial data.")
+            confirm_msg.setInformativeText("Are you sure you want to proceed? This cannot be undone.")
+
+        confirm_msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        confirm_msg.setDefaultButton(QMessageBox.No)
+
+        if confirm_msg.exec_() != QMessageBox.Yes:
+            return None
+
+        return import_file
+
+    def import_database(self, import_file, merge=True):
         """
         Import a database from a previously exported zip archive.
 
+        Shows no dialogs. A merge opens its own connections, so it can run on a worker thread; a replace closes the
+        calling thread's connection to swap the file and must run on the thread that owns it.
+
         Args:
+            import_file: Path of the zip archive to import
             merge: If True, merge imported transactions with existing ones.
                   If False, replace the existing database.
 
@@ -130,36 +173,6 @@ class TreasureGoblinImportExport:
             Tuple (success: bool, message: str) indicating operation result
         """
         try:
-            # Ask user for import file
-            import_file, _ = QFileDialog.getOpenFileName(
-                None,
-                "Import Financial Data",
-                str(Path.home()),
-                "Zip Files (*.zip)"
-            )
-
-            if not import_file:
-                return False, "Import cancelled"
-
-            # Confirm import
-            confirm_msg = QMessageBox()
-            confirm_msg.setIcon(QMessageBox.Warning)
-            confirm_msg.setWindowTitle("Confirm Import")
-
-            if merge:
-                confirm_msg.setText("Merge imported transactions with your current data?")
-                confirm_msg.setInformativeText(
-                    "This will add the imported transactions to your existing financial history.")
-            else:
-                confirm_msg.setText("Importing will replace your current financial data.")
-                confirm_msg.setInformativeText("Are you sure you want to proceed? This cannot be undone.")
-
-            confirm_msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            confirm_msg.setDefaultButton(QMessageBox.No)
-
-            if confirm_msg.exec_() != QMessageBox.Yes:
-                return False, "Import cancelled"
-
             # Get database path
             db_path = self.treasure_goblin.db_path
 
@@ -167,13 +180,6 @@ class TreasureGoblinImportExport:
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
 
-                # Close all existing database connections first
-                try:
-                    conn = self.treasure_goblin.get_db_connection()
-                    conn.close()
-                except:
-                    pass
-
                 # Extract the zip file
                 with zipfile.ZipFile(import_file, 'r') as zipf:
                     zipf.extractall(temp_path)
@@ -196,6 +202,11 @@ class TreasureGoblinImportExport:
                     imported_count, skipped_count = self._merge_databases(db_path, import_db_path)
                     return True, f"Successfully imported and merged {imported_count} transactions. {skipped_count} duplicate transactions were skipped."
                 else:
+                    # Close all existing database connections first
+                    try:
+                        self.treasure_goblin.close_db_connection()
+                    except:
+                        pass
 
                     # Create a backup of the current database
                     backup_path = str(db_path) + ".backup"
@@ -215,6 +226,9 @@ class TreasureGoblinImportExport:
                         with open(import_db_path, 'rb') as src, open(db_path, 'wb') as dst:
                             dst.write(src.read())
 
+                    # Bring the imported file up to the current schema (e.g. dollar amounts to cents)
+                    self.treasure_goblin.setup_database()
+
                     transaction_count = metadata.get("transaction_count", {})
                     total_count = transaction_count.get("total", "unknown")
 
@@ -268,11 +282,22 @@ class TreasureGoblinImportExport:
                     import time
                     time.sleep(1)  # Wait before retrying
 
+            # Match the app's own write connection. The file is already in WAL mode, which persists, so NORMAL
+            # sync only flushes the log at checkpoints instead of on the commit
+            current_cursor.execute("PRAGMA synchronous = NORMAL")
+            current_cursor.execute("PRAGMA temp_store = MEMORY")
+            current_cursor.execute("PRAGMA cache_size = -65536")
+            current_cursor.execute("PRAGMA busy_timeout = 5000")
+
             # Enable foreign keys
             current_cursor.execute("PRAGMA foreign_keys = ON")
 
             # Begin transaction
-            current_conn.execute("BEGIN TRANSACTION")
+            current_conn.execute("BEGIN IMMEDIATE")
+
+            # Databases exported before schema version 2 store amounts in dollars rather than cents
+            import_cursor.execute("PRAGMA user_version")
+            import_in_dollars = import_cursor.fetchone()[0] < 2
 
             # Get all categories from the import database
             import_cursor.execute("SELECT id, name, type FROM categories")
@@ -311,8 +336,7 @@ class TreasureGoblinImportExport:
                 date, amount, type_val, category = row
                 # Ensure consistent formatting for comparison
                 date_str = date.strip() if isinstance(date, str) else date
-                amount_float = float(amount)
-                existing_transactions.add((date_str, amount_float, type_val, category))
+                existing_transactions.add((date_str, int(amount), type_val, category))
 
             # Import transactions from source database
             import_cursor.execute("""
@@ -323,15 +347,20 @@ class TreasureGoblinImportExport:
 
             transactions = import_cursor.fetchall()
 
+            # New rows are collected and inserted in multi-row batches at the end
+            new_transactions = []
+
             # Process each transaction
             for transaction in transactions:
                 transaction_dict = dict(transaction)
+                if import_in_dollars:
+                    transaction_dict['amount'] = to_cents(transaction_dict['amount'])
 
                 # Create tuple for duplicate checking
                 transaction_tuple = (
                     transaction_dict['date'].strip() if isinstance(transaction_dict['date'],
                                                                     str) else transaction_dict['date'],
-                    float(transaction_dict['amount']),
+                    int(transaction_dict['amount']),
                     transaction_dict['type'],
                     transaction_dict['category_name']
                 )
@@ -359,12 +388,8 @@ class TreasureGoblinImportExport:
                         )
                         mapped_category_id = current_cursor.lastrowid
 
-                # Insert transaction with a new ID (don't preserve old IDs)
-                current_cursor.execute("""
-                    INSERT INTO transactions
-                    (type, amount, date, category_id, tag)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+                # Queue the transaction for insert with a new ID (don't preserve old IDs)
+                new_transactions.append((
                     transaction_dict['type'],
                     transaction_dict['amount'],
                     transaction_dict['date'],
@@ -374,7 +399,9 @@ class TreasureGoblinImportExport:
 
                 # Add to existing set to avoid duplicates in the import file
                 existing_transactions.add(transaction_tuple)
-                imported_count += 1
+
+            insert_transactions(current_cursor, new_transactions)
+            imported_count = len(new_transactions)
 
             # Commit all changes
             current_conn.commit()